@@ -24,8 +24,22 @@ import sys
 import time
 import ctypes
 import threading
+import io
 import json
+import math
+import mmap
+import bisect
+import queue
+import socket
+import struct
+import sqlite3
+import tempfile
+import inspect
+import atexit
+import random
+import tracemalloc
 import webbrowser
+from collections import OrderedDict
 import tkinter as tk
 import tkinter.font as tkfont
 from ctypes import wintypes
@@ -34,8 +48,10 @@ from PIL import Image, ImageTk, ImageSequence, ImageDraw
 
 try:
     from pypresence import Presence
+    from pypresence.exceptions import ServerError as DiscordServerError
 except Exception:
     Presence = None
+    DiscordServerError = None
 
 try:
     import keyboard
@@ -47,6 +63,13 @@ try:
 except Exception:
     winsound = None
 
+try:
+    from watchdog.observers import Observer as FileSystemObserver
+    from watchdog.events import FileSystemEventHandler
+except Exception:
+    FileSystemObserver = None
+    FileSystemEventHandler = object
+
 import cv2
 import numpy as np
 
@@ -276,8 +299,13 @@ def set_window_disabled(window, disabled):
 SCRIPT_FOLDER = os.path.dirname(os.path.abspath(__file__))
 RPC_CONFIG_FOLDER = os.path.join(SCRIPT_FOLDER, "rpc_config")
 REFERENCES_FOLDER = os.path.join(SCRIPT_FOLDER, "references")
+SETTINGS_PATH = os.path.join(SCRIPT_FOLDER, "settings.json")
+# Pre-settings.json files, only read once to migrate them
+LEGACY_CONFIG_FOLDER = "config"
 HOTKEYS_CONFIG_PATH = os.path.join(SCRIPT_FOLDER, "hotkeys_config.txt")
 UI_CONFIG_PATH = os.path.join(SCRIPT_FOLDER, "ui_config.txt")
+HISTORY_DB_PATH = os.path.join(SCRIPT_FOLDER, "history.db")
+GAME_CATALOG_INDEX_PATH = os.path.join(SCRIPT_FOLDER, "rpc_catalog.json")
 ALERTS_AUDIO_FOLDER = os.path.join(SCRIPT_FOLDER, "assets", "audio")
 ICON_PATH = os.path.join(SCRIPT_FOLDER, "assets", "rotom", "main", "main_icon.ico")
 FONT_PATH = resource_path(os.path.join("fonts", FONT_FILENAME))
@@ -293,6 +321,9 @@ ICON_AUDIO_ACTIVE_PATH = resource_path(os.path.join("assets", "rotom", "audio",
 ICON_COUNT_ERROR_PATH = resource_path(os.path.join("assets", "rotom", "count", "icon_count_error.png"))
 ICON_RPC_ERROR_PATH = resource_path(os.path.join("assets", "rotom", "count", "icon_rpc_error.png"))
 ICON_RESET_PATH = resource_path(os.path.join("assets", "ui", "reset.png"))
+POKEMON_ICONS_FOLDER = resource_path(os.path.join("assets", "pokemon_icons"))
+# Built from POKEMON_ICONS_FOLDER with --build-sprite-atlas
+POKEMON_SPRITE_ATLAS_PATH = resource_path(os.path.join("assets", "pokemon_icons.atlas"))
 
 # UI Audio Paths
 UI_SOUND_START_PATH = resource_path(os.path.join("assets", "ui_audio", "start.wav"))
@@ -316,11 +347,12 @@ DEFAULT_HOTKEYS = {
 # =========================
 # GLOBALS
 # =========================
-ACTIVE_BROADCAST_PROFILE = None
 hotkey_manager = None
+FILE_WATCHER = None
 RUN_BADGE_IMG = None
 TOOLTIP_ENABLED = True
 TOOLTIP_ENABLED_KEY = "tooltips_enabled:"
+PRESENCE_MODE_KEY = "presence_mode:"
 TOOLTIP_ICON = None
 
 
@@ -958,36 +990,21 @@ def play_ui_sound(sound_path):
 
 
 def load_tooltip_enabled():
-    if not os.path.exists(UI_CONFIG_PATH):
-        return True
-    try:
-        with open(UI_CONFIG_PATH, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.lower().startswith(TOOLTIP_ENABLED_KEY):
-                    return line.split(":", 1)[1].strip() == "1"
-    except Exception:
-        return True
-    return True
+    return SETTINGS.ui.get_value(TOOLTIP_ENABLED_KEY, True)
 
 
 def save_tooltip_enabled(enabled):
-    try:
-        lines = []
-        if os.path.exists(UI_CONFIG_PATH):
-            with open(UI_CONFIG_PATH, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-        wrote = False
-        for i, line in enumerate(lines):
-            if line.lower().startswith(TOOLTIP_ENABLED_KEY):
-                lines[i] = f"{TOOLTIP_ENABLED_KEY} {'1' if enabled else '0'}\n"
-                wrote = True
-                break
-        if not wrote:
-            lines.append(f"{TOOLTIP_ENABLED_KEY} {'1' if enabled else '0'}\n")
-        with open(UI_CONFIG_PATH, "w", encoding="utf-8") as f:
-            f.writelines(lines)
-    except Exception:
-        pass
+    SETTINGS.ui.set(TOOLTIP_ENABLED_KEY, bool(enabled))
+    SETTINGS.flush()
+
+
+def load_presence_mode():
+    return SETTINGS.ui.get(PRESENCE_MODE_KEY, PRESENCE_MODE_ROTATE)
+
+
+def save_presence_mode(mode):
+    SETTINGS.ui.set(PRESENCE_MODE_KEY, mode)
+    SETTINGS.flush()
 
 
 def add_tooltip(widget, text):
@@ -1028,7 +1045,7 @@ def add_tooltip(widget, text):
             icon_label = tk.Label(container, image=TOOLTIP_ICON, bg=DARK_ACCENT)
             icon_label.grid(row=0, column=0, padx=(6, 4), pady=4, sticky="ns")
         text_label = tk.Label(
-            container, text=text, bg=DARK_ACCENT, fg=DARK_FG, justify="center",
+            container, text=text() if callable(text) else text, bg=DARK_ACCENT, fg=DARK_FG, justify="center",
             font=(FONT_NAME, BASE_FONT_SIZE - 1), wraplength=300
         )
         text_label.grid(row=0, column=1, padx=(4, 6), pady=4, sticky="w")
@@ -1264,33 +1281,43 @@ def show_reset_confirmation(profile_name, parent=None):
 # =========================
 # WINDOWS API HELPERS
 # =========================
-user32 = ctypes.WinDLL("user32", use_last_error=True)
-gdi32 = ctypes.WinDLL("gdi32", use_last_error=True)
-
-EnumWindows = user32.EnumWindows
-EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
-GetWindowText = user32.GetWindowTextW
-GetWindowTextLength = user32.GetWindowTextLengthW
-IsWindowVisible = user32.IsWindowVisible
-IsIconic = user32.IsIconic
-GetClientRect = user32.GetClientRect
-ClientToScreen = user32.ClientToScreen
-GetWindowRect = user32.GetWindowRect
-GetWindowDC = user32.GetWindowDC
-ReleaseDC = user32.ReleaseDC
-PrintWindow = user32.PrintWindow
-
-CreateCompatibleDC = gdi32.CreateCompatibleDC
-CreateCompatibleBitmap = gdi32.CreateCompatibleBitmap
-SelectObject = gdi32.SelectObject
-DeleteObject = gdi32.DeleteObject
-DeleteDC = gdi32.DeleteDC
-GetDIBits = gdi32.GetDIBits
-BitBlt = gdi32.BitBlt
+# Guarded so the offline benchmarks (see BENCHMARKS) can import on other platforms
+if os.name == "nt":
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    gdi32 = ctypes.WinDLL("gdi32", use_last_error=True)
+
+    EnumWindows = user32.EnumWindows
+    EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+    GetWindowText = user32.GetWindowTextW
+    GetWindowTextLength = user32.GetWindowTextLengthW
+    IsWindowVisible = user32.IsWindowVisible
+    IsIconic = user32.IsIconic
+    GetClientRect = user32.GetClientRect
+    ClientToScreen = user32.ClientToScreen
+    GetWindowRect = user32.GetWindowRect
+    GetWindowDC = user32.GetWindowDC
+    GetDC = user32.GetDC
+    ReleaseDC = user32.ReleaseDC
+    PrintWindow = user32.PrintWindow
+    IsWindow = user32.IsWindow
+
+    CreateCompatibleDC = gdi32.CreateCompatibleDC
+    CreateCompatibleBitmap = gdi32.CreateCompatibleBitmap
+    SelectObject = gdi32.SelectObject
+    DeleteObject = gdi32.DeleteObject
+    DeleteDC = gdi32.DeleteDC
+    GetDIBits = gdi32.GetDIBits
+    BitBlt = gdi32.BitBlt
+    StretchBlt = gdi32.StretchBlt
+    SetStretchBltMode = gdi32.SetStretchBltMode
+    SetBrushOrgEx = gdi32.SetBrushOrgEx
 
 BI_RGB = 0
 DIB_RGB_COLORS = 0
 SRCCOPY = 0x00CC0020
+PW_CLIENTONLY = 0x00000001
+PW_RENDERFULLCONTENT = 0x00000002
+HALFTONE = 4
 
 
 class BITMAPINFOHEADER(ctypes.Structure):
@@ -1335,6 +1362,519 @@ CONFIG_KEY_ALERT_ENABLED = "alert_enabled:"
 CONFIG_KEY_ALERT_PLAY_MANUAL = "alert_play_manual:"
 CONFIG_KEY_ALERT_PLAY_HOTKEY = "alert_play_hotkey:"
 CONFIG_KEY_ALERT_PLAY_AUTO = "alert_play_auto:"
+CONFIG_KEY_COUNT_INSTANCES = "count_instances:"
+
+CONFIG_KEY_MATCH_METHOD = "match_method:"
+CONFIG_KEY_CAPTURE_CLIENT_ONLY = "capture_client_only:"
+CONFIG_KEY_CAPTURE_CROP = "capture_crop:"
+CONFIG_KEY_CAPTURE_SCALE = "capture_scale:"
+
+MAX_MATCH_INSTANCES = 16  # Upper bound for matches counted in a single frame
+
+MATCH_METHOD_TEMPLATE = "template"
+MATCH_METHOD_FEATURES = "features"
+FEATURE_REFERENCE_FEATURES = 500    # Keypoints extracted from the reference frame
+FEATURE_FRAME_FEATURES = 3000       # Keypoints extracted from each captured frame
+FEATURE_EDGE_PADDING = 31           # ORB skips this many pixels at image borders; pad small references
+FEATURE_RATIO_TEST = 0.75           # Lowe ratio test for ambiguous descriptor matches
+FEATURE_MIN_INLIERS = 10            # Geometrically consistent matches needed to count as detected
+FEATURE_MAX_FRAME_WIDTH = 960       # Wider frames are downscaled before keypoint extraction
+
+CAPTURE_SCALE_OPTIONS = [
+    ("Full", 1.0),
+    ("Half", 0.5),
+    ("Quarter", 0.25),
+]
+CAPTURE_METHOD_PRINT_FULL = "printwindow_full"  # PrintWindow with PW_RENDERFULLCONTENT (DirectX/OBS windows)
+CAPTURE_METHOD_PRINT = "printwindow"             # Plain PrintWindow
+CAPTURE_METHOD_BITBLT = "bitblt"                 # Copies screen pixels, so anything covering the window is captured too
+CAPTURE_METHODS = (CAPTURE_METHOD_PRINT_FULL, CAPTURE_METHOD_PRINT, CAPTURE_METHOD_BITBLT)
+CAPTURE_BLANK_RESELECT = 20        # Black frames in a row before a method picked from black frames is tried again
+WATCHDOG_DEADLINE_SECONDS = 2.0    # A capture + match taking longer than this is abandoned
+WATCHDOG_POLL_MS = 25              # How often the Tk thread checks for a finished capture
+WATCHDOG_MAX_BACKOFF_STEPS = 4     # Poll interval doubles per consecutive stall, up to 16x
+WATCHDOG_DEGRADE_AFTER = 3         # Consecutive stalls before dropping to degraded polling
+WATCHDOG_DEGRADED_INTERVAL = 5.0   # Seconds between ticks in degraded polling
+COUNTER_FLUSH_DELAY = 0.25  # Seconds of quiet before counter changes are written for OBS
+FILE_WATCH_POLL_MS = 1000        # mtime polling interval for settings.json and reference images
+FILE_WATCH_NATIVE_POLL_MS = 250  # Interval when the watchdog package reports changes instead
+TEMPLATE_CACHE_SIZE = 8  # Scaled references kept in memory (3 profiles x a couple of scales)
+
+
+SETTINGS_VERSION = 1
+
+# Types of every value settings.json may hold. Keys are the old "key:" names without the colon.
+PROFILE_SETTINGS_SCHEMA = {
+    CONFIG_KEY_PROFILE_NAME: str,
+    CONFIG_KEY_TITLE: str,
+    CONFIG_KEY_COOLDOWN: int,
+    CONFIG_KEY_FREQUENCY: float,
+    CONFIG_KEY_THRESHOLD: float,
+    CONFIG_KEY_IMAGE: str,
+    CONFIG_KEY_TEXT: str,
+    CONFIG_KEY_INCREMENT: int,
+    CONFIG_KEY_RPC_GAME: str,
+    CONFIG_KEY_RPC_TARGET: str,
+    CONFIG_KEY_RPC_ODDS: int,
+    CONFIG_KEY_RPC_ENABLED: bool,
+    CONFIG_KEY_RPC_SUFFIX: str,
+    CONFIG_KEY_COUNT_PLUS: str,
+    CONFIG_KEY_COUNT_MINUS: str,
+    CONFIG_KEY_ALERT_SOUND: str,
+    CONFIG_KEY_ALERT_ENABLED: bool,
+    CONFIG_KEY_ALERT_PLAY_MANUAL: bool,
+    CONFIG_KEY_ALERT_PLAY_HOTKEY: bool,
+    CONFIG_KEY_ALERT_PLAY_AUTO: bool,
+    CONFIG_KEY_COUNT_INSTANCES: bool,
+    CONFIG_KEY_MATCH_METHOD: str,
+    CONFIG_KEY_CAPTURE_CLIENT_ONLY: bool,
+    CONFIG_KEY_CAPTURE_CROP: str,
+    CONFIG_KEY_CAPTURE_SCALE: float,
+}
+HOTKEY_SETTINGS_SCHEMA = {
+    "global_enabled": bool,
+    "start_stop": str,
+    "capture": str,
+}
+UI_SETTINGS_SCHEMA = {
+    TOOLTIP_ENABLED_KEY: bool,
+    PRESENCE_MODE_KEY: str,
+}
+
+# Each entry upgrades a document from that version to the next one
+SETTINGS_MIGRATIONS = {}
+
+
+def settings_key(key):
+    return key.strip().rstrip(":").strip().lower()
+
+
+def coerce_setting(kind, value):
+    """Convert value to the schema type; raises ValueError/TypeError if it doesn't fit."""
+    if kind is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in ("1", "true"):
+            return True
+        if text in ("0", "false"):
+            return False
+        raise ValueError(f"not a flag: {value!r}")
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"unexpected value: {value!r}")
+    if kind is int:
+        return int(str(value).strip())
+    if kind is float:
+        return float(value)
+    return str(value)
+
+
+def read_legacy_settings(path):
+    """Parse one of the old "key: value" text files; the first occurrence of a key wins."""
+    values = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                name, sep, value = line.partition(":")
+                if sep and settings_key(name) not in values:
+                    values[settings_key(name)] = value.strip()
+    except OSError:
+        pass
+    return values
+
+
+class SettingsSection:
+    """
+    One part of settings.json (a profile, the hotkeys or the UI options).
+
+    get() returns values in the old text form ("1"/"0" for flags) so existing callers keep
+    working, while the document itself stores real types. set() only marks the store dirty
+    when a value actually changes; an empty value removes the key so the caller's default
+    applies again, just like an empty line used to.
+    """
+
+    def __init__(self, store, values, schema):
+        self.store = store
+        self._values = values
+        self._schema = {settings_key(key): kind for key, kind in schema.items()}
+
+    def get_value(self, key, default_value):
+        with self.store.lock:
+            return self._values.get(settings_key(key), default_value)
+
+    def get(self, key, default_value):
+        value = self.get_value(key, None)
+        if value is None:
+            return default_value
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        return str(value)
+
+    def set(self, key, value):
+        key = settings_key(key)
+        kind = self._schema.get(key, str)
+        if value is None or (isinstance(value, str) and not value.strip() and kind is not str):
+            new_value = None
+        else:
+            try:
+                new_value = coerce_setting(kind, value)
+            except (TypeError, ValueError):
+                new_value = None
+        with self.store.lock:
+            if new_value is None:
+                if key not in self._values:
+                    return
+                del self._values[key]
+            else:
+                if key in self._values and self._values[key] == new_value:
+                    return
+                self._values[key] = new_value
+            self.store.mark_dirty()
+
+    @property
+    def dirty(self):
+        return self.store.dirty
+
+    def flush(self):
+        return self.store.flush()
+
+
+class SettingsStore:
+    """
+    settings.json: every profile's settings plus the hotkey and UI options in one versioned
+    document, read once at startup.
+
+    Values are checked against the schemas above when the file is loaded; anything of the
+    wrong type is dropped so the built-in default is used instead. If there's no settings.json
+    yet, it's built from the old config/configN.txt, hotkeys_config.txt and ui_config.txt
+    files (those are left on disk untouched). Saves rewrite the document through a temp
+    file and os.replace, and only when something actually changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self._document = None
+        self._sections = {}
+        self._dirty = False
+        self._file_signature = None
+        self._saved = None  # Copy of the document as last read from / written to disk
+
+    @staticmethod
+    def _snapshot(document):
+        return {
+            "profiles": {index: dict(values) for index, values in document["profiles"].items()},
+            "hotkeys": dict(document["hotkeys"]),
+            "ui": dict(document["ui"]),
+        }
+
+    @staticmethod
+    def _merge(current, saved, external):
+        """
+        Apply the keys that changed on disk (saved -> external) to current, leaving keys only
+        changed in memory alone. Returns True if current changed.
+        """
+        changed = False
+        missing = object()
+        for key in set(saved) | set(external):
+            value = external.get(key, missing)
+            if saved.get(key, missing) == value or current.get(key, missing) == value:
+                continue
+            if value is missing:
+                del current[key]
+            else:
+                current[key] = value
+            changed = True
+        return changed
+
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_file(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        if not isinstance(document, dict):
+            raise ValueError("settings.json must hold an object")
+        return document
+
+    def _load(self):
+        """Read, migrate and validate the document on first use. Call with the lock held."""
+        if self._document is not None:
+            return
+        document = None
+        if os.path.exists(self.path):
+            try:
+                document = self._read_file()
+                self._file_signature = self._signature()
+            except (OSError, ValueError):
+                # Keep the unreadable file around instead of silently overwriting it
+                try:
+                    os.replace(self.path, f"{self.path}.bad")
+                except OSError:
+                    pass
+                document = None
+        if document is None:
+            document = self._migrate_legacy()
+            self._dirty = True
+            self._document = self._upgrade(document)
+            self._saved = {"profiles": {}, "hotkeys": {}, "ui": {}}
+        else:
+            self._document = self._upgrade(document)
+            self._saved = self._snapshot(self._document)
+
+    def _upgrade(self, document):
+        version = document.get("version", 0)
+        while isinstance(version, int) and version in SETTINGS_MIGRATIONS:
+            document = SETTINGS_MIGRATIONS[version](document)
+            version = document.get("version", version + 1)
+            self._dirty = True
+        document["version"] = SETTINGS_VERSION
+
+        profiles = document.get("profiles")
+        if not isinstance(profiles, dict):
+            profiles = {}
+        document["profiles"] = {
+            str(index): self._validate(values, PROFILE_SETTINGS_SCHEMA)
+            for index, values in profiles.items()
+        }
+        document["hotkeys"] = self._validate(document.get("hotkeys"), HOTKEY_SETTINGS_SCHEMA)
+        document["ui"] = self._validate(document.get("ui"), UI_SETTINGS_SCHEMA)
+        return document
+
+    def reload(self):
+        """
+        Pick up edits made to settings.json outside the app and return the indexes of the
+        profiles whose values changed. Our own writes and half-written files are ignored.
+
+        Only keys that changed on disk since our last read or write are applied, so edits
+        still waiting for the next flush survive the reload and are written out with it.
+        """
+        with self.lock:
+            if self._document is None:
+                return []
+            signature = self._signature()
+            if signature is None or signature == self._file_signature:
+                return []
+            try:
+                document = self._read_file()
+            except (OSError, ValueError):
+                return []
+            self._file_signature = signature
+            was_dirty = self._dirty
+            document = self._upgrade(document)
+            self._dirty = was_dirty
+
+            # Sections hold these dicts, so they are updated in place
+            changed = []
+            saved = self._saved
+            for index in set(document["profiles"]) | set(saved["profiles"]):
+                current = self._document["profiles"].setdefault(index, {})
+                if self._merge(current, saved["profiles"].get(index, {}), document["profiles"].get(index, {})):
+                    changed.append(int(index) if index.isdigit() else index)
+            for name in ("hotkeys", "ui"):
+                self._merge(self._document[name], saved[name], document[name])
+            self._saved = self._snapshot(document)
+            return changed
+
+    def _validate(self, values, schema):
+        if not isinstance(values, dict):
+            if values is not None:
+                self._dirty = True
+            return {}
+        valid = {}
+        for key, kind in schema.items():
+            key = settings_key(key)
+            if key not in values:
+                continue
+            try:
+                valid[key] = coerce_setting(kind, values[key])
+            except (TypeError, ValueError):
+                self._dirty = True
+                continue
+            if valid[key] != values[key]:
+                self._dirty = True
+        if len(valid) != len(values):
+            self._dirty = True
+        return valid
+
+    def _migrate_legacy(self):
+        profiles = {}
+        try:
+            names = os.listdir(LEGACY_CONFIG_FOLDER)
+        except OSError:
+            names = []
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext.lower() == ".txt" and stem.lower().startswith("config") and stem[6:].isdigit():
+                profiles[str(int(stem[6:]))] = read_legacy_settings(os.path.join(LEGACY_CONFIG_FOLDER, name))
+        return {
+            "version": SETTINGS_VERSION,
+            "profiles": profiles,
+            "hotkeys": read_legacy_settings(HOTKEYS_CONFIG_PATH),
+            "ui": read_legacy_settings(UI_CONFIG_PATH),
+        }
+
+    def _section(self, name, values, schema):
+        section = self._sections.get(name)
+        if section is None:
+            section = SettingsSection(self, values, schema)
+            self._sections[name] = section
+        return section
+
+    def profile(self, profile_index):
+        with self.lock:
+            self._load()
+            values = self._document["profiles"].setdefault(str(profile_index), {})
+            return self._section(f"profile{profile_index}", values, PROFILE_SETTINGS_SCHEMA)
+
+    @property
+    def hotkeys(self):
+        with self.lock:
+            self._load()
+            return self._section("hotkeys", self._document["hotkeys"], HOTKEY_SETTINGS_SCHEMA)
+
+    @property
+    def ui(self):
+        with self.lock:
+            self._load()
+            return self._section("ui", self._document["ui"], UI_SETTINGS_SCHEMA)
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    @property
+    def dirty(self):
+        return self._dirty
+
+    def flush(self):
+        """Write pending changes in one go; returns False if the file couldn't be written."""
+        with self.lock:
+            if not self._dirty or self._document is None:
+                return True
+            payload = json.dumps(self._document, indent=2, sort_keys=True)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(temp_path, self.path)
+            except OSError:
+                return False
+            self._file_signature = self._signature()
+            self._saved = self._snapshot(self._document)
+            self._dirty = False
+            return True
+
+
+class FileWatcher:
+    """
+    Calls back on the Tk thread when a watched file changes on disk or disappears.
+
+    Polls modification times by default, one stat per file every FILE_WATCH_POLL_MS. When
+    the optional watchdog package is installed, its native observer flags changed files
+    instead and the poll only checks those, so it can run more often for less.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._lock = threading.Lock()
+        self._watches = {}          # key -> (path, callback)
+        self._signatures = {}       # path -> (mtime_ns, size) or None
+        self._pending = set()       # paths the native observer saw change
+        self._observer = None
+        self._observed_folders = set()
+        if FileSystemObserver is not None:
+            try:
+                self._observer = FileSystemObserver()
+                self._observer.daemon = True
+                self._observer.start()
+            except Exception:
+                self._observer = None
+        self.widget.after(self._interval(), self._poll)
+
+    def _interval(self):
+        return FILE_WATCH_NATIVE_POLL_MS if self._observer is not None else FILE_WATCH_POLL_MS
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def watch(self, key, path, callback):
+        """Watch path under key, replacing whatever was watched under that key before."""
+        path = os.path.abspath(path) if path else ""
+        with self._lock:
+            if not path:
+                self._watches.pop(key, None)
+                return
+            self._watches[key] = (path, callback)
+            if path not in self._signatures:
+                self._signatures[path] = self._stat(path)
+        self._observe_folder(os.path.dirname(path))
+
+    def _observe_folder(self, folder):
+        if self._observer is None or not folder or folder in self._observed_folders:
+            return
+        if not os.path.isdir(folder):
+            return
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                with watcher._lock:
+                    for attr in ("src_path", "dest_path"):
+                        changed = getattr(event, attr, None)
+                        if changed:
+                            watcher._pending.add(os.path.abspath(changed))
+
+        try:
+            self._observer.schedule(Handler(), folder, recursive=False)
+            self._observed_folders.add(folder)
+        except Exception:
+            pass
+
+    def _poll(self):
+        with self._lock:
+            watches = list(self._watches.values())
+            if self._observer is not None:
+                # Folders that couldn't be observed are still polled
+                candidates = {
+                    path for path, _ in watches
+                    if path in self._pending or os.path.dirname(path) not in self._observed_folders
+                }
+                self._pending.clear()
+            else:
+                candidates = {path for path, _ in watches}
+
+        changed = set()
+        for path in candidates:
+            signature = self._stat(path)
+            if signature != self._signatures.get(path):
+                # Deleted files are reported too, so a missing path is noticed
+                self._signatures[path] = signature
+                changed.add(path)
+
+        for path, callback in watches:
+            if path in changed:
+                try:
+                    callback(path)
+                except Exception:
+                    pass
+
+        self.widget.after(self._interval(), self._poll)
+
+
+SETTINGS = SettingsStore(SETTINGS_PATH)
+atexit.register(SETTINGS.flush)
 
 
 # =========================
@@ -1393,107 +1933,1050 @@ def is_window_minimized(hwnd):
     return bool(IsIconic(hwnd))
 
 
-def grab_window_image(hwnd):
+def get_client_offset(hwnd):
+    """Offset of the client area's top-left corner from the window's top-left corner."""
     window_rect = wintypes.RECT()
     if not GetWindowRect(hwnd, ctypes.byref(window_rect)):
         raise RuntimeError("Failed to get window rect.")
 
-    window_width = window_rect.right - window_rect.left
-    window_height = window_rect.bottom - window_rect.top
+    origin = wintypes.POINT(0, 0)
+    if not ClientToScreen(hwnd, ctypes.byref(origin)):
+        raise RuntimeError("Failed to get client area position.")
 
-    if window_width <= 0 or window_height <= 0:
-        raise RuntimeError("Invalid window size.")
+    return origin.x - window_rect.left, origin.y - window_rect.top
 
-    hwnd_dc = GetWindowDC(hwnd)
-    mem_dc = CreateCompatibleDC(hwnd_dc)
-    bitmap = CreateCompatibleBitmap(hwnd_dc, window_width, window_height)
-    SelectObject(mem_dc, bitmap)
 
-    result = PrintWindow(hwnd, mem_dc, 0x00000002)
-    if not result:
-        result = PrintWindow(hwnd, mem_dc, 0x00000000)
+def parse_capture_crop(value):
+    """Parse a stored "x,y,width,height" capture area; returns None if unset or invalid."""
+    try:
+        x, y, w, h = (int(part) for part in str(value).split(","))
+    except ValueError:
+        return None
+    if w <= 0 or h <= 0:
+        return None
+    return x, y, w, h
 
-    if not result:
-        if not BitBlt(mem_dc, 0, 0, window_width, window_height, hwnd_dc, 0, 0, SRCCOPY):
-            raise RuntimeError("Failed to capture the window.")
 
+def format_capture_crop(crop):
+    return ",".join(str(v) for v in crop) if crop else ""
+
+
+def clamp_capture_crop(crop, width, height):
+    """Clamp an (x, y, w, h) crop to a width x height area; None if nothing is left."""
+    x, y, w, h = crop
+    left = max(0, x)
+    top = max(0, y)
+    right = min(width, x + w)
+    bottom = min(height, y + h)
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right - left, bottom - top
+
+
+class CaptureResources:
+    """
+    Owns the device contexts, bitmaps and pixel buffers of one capture.
+
+    Everything acquired through it is released in reverse order when the with-block exits,
+    including when a GDI call fails halfway. live_counts() reports what is currently
+    outstanding across all captures, which should be zero between captures.
+    """
+
+    _lock = threading.Lock()
+    _live = {"window_dc": 0, "memory_dc": 0, "bitmap": 0, "selection": 0, "buffer": 0}
+
+    def __init__(self, hwnd):
+        self.hwnd = hwnd
+        self._releases = []
+
+    @classmethod
+    def live_counts(cls):
+        with cls._lock:
+            return dict(cls._live)
+
+    def _track(self, kind, release):
+        with self._lock:
+            self._live[kind] += 1
+        self._releases.append((kind, release))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        while self._releases:
+            kind, release = self._releases.pop()
+            try:
+                if release:
+                    release()
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._live[kind] -= 1
+        return False
+
+    def window_dc(self, client_only):
+        dc = GetDC(self.hwnd) if client_only else GetWindowDC(self.hwnd)
+        if not dc:
+            raise RuntimeError("Failed to get the window device context.")
+        self._track("window_dc", lambda: ReleaseDC(self.hwnd, dc))
+        return dc
+
+    def memory_dc(self, source_dc):
+        dc = CreateCompatibleDC(source_dc)
+        if not dc:
+            raise RuntimeError("Failed to create a memory device context.")
+        self._track("memory_dc", lambda: DeleteDC(dc))
+        return dc
+
+    def bitmap(self, source_dc, target_dc, width, height):
+        """Create a bitmap and select it into target_dc; it is deselected again before deletion."""
+        bitmap = CreateCompatibleBitmap(source_dc, width, height)
+        if not bitmap:
+            raise RuntimeError("Failed to create a capture bitmap.")
+        self._track("bitmap", lambda: DeleteObject(bitmap))
+        # A bitmap that is still selected into a DC can't be deleted, so put the old one back first
+        previous = SelectObject(target_dc, bitmap)
+        self._track("selection", lambda: SelectObject(target_dc, previous))
+        return bitmap
+
+    def buffer(self, size):
+        buffer = ctypes.create_string_buffer(size)
+        self._track("buffer", None)
+        return buffer
+
+
+# Shared by every profile's DetectionWatchdog worker and the Tk thread
+# (hwnd, client_only) -> ((width, height), capture method, black frames in a row or None).
+# The count is None once a method produced a real frame; otherwise the method was only the
+# first one that rendered anything and gets re-selected, see grab_window_image.
+_capture_methods = {}
+_capture_methods_lock = threading.Lock()
+
+
+def _render_window(method, hwnd, hwnd_dc, mem_dc, width, height, client_only):
+    """Draw the window into mem_dc with one capture method; returns True on success."""
+    base_flags = PW_CLIENTONLY if client_only else 0
+    if method == CAPTURE_METHOD_PRINT_FULL:
+        return bool(PrintWindow(hwnd, mem_dc, base_flags | PW_RENDERFULLCONTENT))
+    if method == CAPTURE_METHOD_PRINT:
+        return bool(PrintWindow(hwnd, mem_dc, base_flags))
+    return bool(BitBlt(mem_dc, 0, 0, width, height, hwnd_dc, 0, 0, SRCCOPY))
+
+
+def _read_bitmap(resources, dc, bitmap, width, height):
     bmi = BITMAPINFO()
     bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-    bmi.bmiHeader.biWidth = window_width
-    bmi.bmiHeader.biHeight = -window_height
+    bmi.bmiHeader.biWidth = width
+    bmi.bmiHeader.biHeight = -height
     bmi.bmiHeader.biPlanes = 1
     bmi.bmiHeader.biBitCount = 32
     bmi.bmiHeader.biCompression = BI_RGB
 
-    buffer = ctypes.create_string_buffer(window_width * window_height * 4)
-    bits = GetDIBits(mem_dc, bitmap, 0, window_height, buffer, ctypes.byref(bmi), DIB_RGB_COLORS)
+    buffer = resources.buffer(width * height * 4)
+    bits = GetDIBits(dc, bitmap, 0, height, buffer, ctypes.byref(bmi), DIB_RGB_COLORS)
     if bits == 0:
         raise RuntimeError("GetDIBits failed.")
+    return buffer
+
 
-    img = Image.frombuffer("RGBA", (window_width, window_height), buffer, "raw", "BGRA", 0, 1)
+def _is_blank_frame(buffer):
+    """True if every pixel is black (alpha is ignored; PrintWindow usually leaves it at 0)."""
+    pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 4)
+    return not pixels[:, :3].any()
 
-    DeleteObject(bitmap)
-    DeleteDC(mem_dc)
-    ReleaseDC(hwnd, hwnd_dc)
+
+def _select_capture_method(resources, hwnd_dc, mem_dc, bitmap, width, height, client_only):
+    """
+    Try every capture method once and return the one to keep using for this window.
+
+    The fastest PrintWindow variant that produces a non-black frame wins. BitBlt is only
+    used when neither does, since it copies whatever is on screen over the window. If
+    every method comes back black (e.g. a loading screen) the first one that worked is
+    returned as provisional. Returns (method, provisional).
+    """
+    best_method = None
+    best_time = None
+    first_working = None
+    for method in CAPTURE_METHODS:
+        if method == CAPTURE_METHOD_BITBLT and best_method is not None:
+            break
+        start = time.perf_counter()
+        if not _render_window(method, resources.hwnd, hwnd_dc, mem_dc, width, height, client_only):
+            continue
+        elapsed = time.perf_counter() - start
+        if first_working is None:
+            first_working = method
+        if _is_blank_frame(_read_bitmap(resources, mem_dc, bitmap, width, height)):
+            continue
+        if best_time is None or elapsed < best_time:
+            best_method, best_time = method, elapsed
+
+    if best_method is not None:
+        return best_method, False
+    return first_working, True
+
+
+def _forget_closed_windows():
+    """Drop remembered capture methods of windows that no longer exist. Call with the lock held."""
+    for key in [key for key in _capture_methods if not IsWindow(key[0])]:
+        del _capture_methods[key]
+
+
+def get_capture_method(hwnd, client_only=False):
+    """Capture method currently remembered for a window, or None if it hasn't been captured yet."""
+    with _capture_methods_lock:
+        entry = _capture_methods.get((hwnd, client_only))
+    return entry[1] if entry else None
+
+
+def grab_window_image(hwnd, client_only=False, crop=None, scale=1.0):
+    """
+    Capture a window into an RGBA image.
+
+    client_only drops the title bar and borders. crop is an optional (x, y, w, h) area in
+    window coordinates (as seen in a full-window capture); in client mode it is shifted by
+    the client area offset, so areas picked in either mode keep pointing at the same pixels.
+    scale below 1.0 shrinks the frame in GDI (a StretchBlt into a memory DC, on the CPU)
+    before the DIB copy into Python.
+
+    The capture method is picked once per window and reused until the window is resized
+    or the method stops working. A method picked while every method gave a black frame is
+    picked again once frames stop being black, or after CAPTURE_BLANK_RESELECT black frames.
+    """
+    if client_only:
+        client_rect = wintypes.RECT()
+        if not GetClientRect(hwnd, ctypes.byref(client_rect)):
+            raise RuntimeError("Failed to get client rect.")
+        window_width = client_rect.right - client_rect.left
+        window_height = client_rect.bottom - client_rect.top
+    else:
+        window_rect = wintypes.RECT()
+        if not GetWindowRect(hwnd, ctypes.byref(window_rect)):
+            raise RuntimeError("Failed to get window rect.")
+        window_width = window_rect.right - window_rect.left
+        window_height = window_rect.bottom - window_rect.top
+
+    if window_width <= 0 or window_height <= 0:
+        raise RuntimeError("Invalid window size.")
+
+    if crop:
+        if client_only:
+            offset_x, offset_y = get_client_offset(hwnd)
+            crop = (crop[0] - offset_x, crop[1] - offset_y, crop[2], crop[3])
+        crop = clamp_capture_crop(crop, window_width, window_height)
+        if crop is None:
+            raise RuntimeError("Capture area is outside the window.")
+
+    with CaptureResources(hwnd) as resources:
+        hwnd_dc = resources.window_dc(client_only)
+        mem_dc = resources.memory_dc(hwnd_dc)
+        bitmap = resources.bitmap(hwnd_dc, mem_dc, window_width, window_height)
+
+        # Full-window and client-only captures of the same window are remembered separately,
+        # so profiles using both modes on one window don't keep re-selecting each other's method
+        cache_key = (hwnd, client_only)
+        size = (window_width, window_height)
+        with _capture_methods_lock:
+            entry = _capture_methods.get(cache_key)
+        method, blank_frames = (entry[1], entry[2]) if entry and entry[0] == size else (None, None)
+
+        result = False
+        selected = False
+        if method:
+            result = _render_window(method, hwnd, hwnd_dc, mem_dc, window_width, window_height, client_only)
+            if not result:
+                # The remembered method stopped working; forget it even if re-selecting fails too
+                with _capture_methods_lock:
+                    _capture_methods.pop(cache_key, None)
+        if not result:
+            # First capture, resized window or the remembered method stopped working
+            method, provisional = _select_capture_method(
+                resources, hwnd_dc, mem_dc, bitmap, window_width, window_height, client_only
+            )
+            blank_frames = 0 if provisional else None
+            selected = True
+            if method:
+                result = _render_window(method, hwnd, hwnd_dc, mem_dc, window_width, window_height, client_only)
+        if not result:
+            raise RuntimeError("Failed to capture the window.")
+
+        out_dc, out_bitmap = mem_dc, bitmap
+        out_width, out_height = window_width, window_height
+        if crop or scale < 1.0:
+            # Copy just the capture area out (and shrink it) so the DIB buffer and everything after it stay small
+            src_x, src_y, src_width, src_height = crop or (0, 0, window_width, window_height)
+            out_width = max(1, int(round(src_width * scale)))
+            out_height = max(1, int(round(src_height * scale)))
+            out_dc = resources.memory_dc(hwnd_dc)
+            out_bitmap = resources.bitmap(hwnd_dc, out_dc, out_width, out_height)
+            if scale < 1.0:
+                SetStretchBltMode(out_dc, HALFTONE)
+                SetBrushOrgEx(out_dc, 0, 0, None)
+                StretchBlt(out_dc, 0, 0, out_width, out_height, mem_dc, src_x, src_y, src_width, src_height, SRCCOPY)
+            else:
+                BitBlt(out_dc, 0, 0, out_width, out_height, mem_dc, src_x, src_y, SRCCOPY)
+
+        buffer = _read_bitmap(resources, out_dc, out_bitmap, out_width, out_height)
+        # Image.frombuffer copies BGRA into RGBA, so the buffer can go as soon as the with-block ends
+        img = Image.frombuffer("RGBA", (out_width, out_height), buffer, "raw", "BGRA", 0, 1)
+        if blank_frames is not None and not selected:
+            # Provisional method reused: once it shows something (or stays black for long), pick again
+            blank_frames = blank_frames + 1 if _is_blank_frame(buffer) else CAPTURE_BLANK_RESELECT
+        with _capture_methods_lock:
+            if entry is None:
+                _forget_closed_windows()
+            if blank_frames is not None and blank_frames >= CAPTURE_BLANK_RESELECT:
+                _capture_methods.pop(cache_key, None)
+            else:
+                _capture_methods[cache_key] = (size, method, blank_frames)
 
     return img
 
 
-def compare_images(screenshot_image, template_path, threshold=0.90):
-    screenshot_gray = cv2.cvtColor(np.array(screenshot_image), cv2.COLOR_RGBA2GRAY)
-    template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+def count_match_instances(result, threshold, template_size, max_instances=MAX_MATCH_INSTANCES):
+    """
+    Count separate locations in a matchTemplate correlation map that reach the threshold.
 
-    if template is None:
+    Greedy non-maximum suppression: take the best peak, blank out a window of half the
+    template size around it and repeat. The map is modified in place.
+    """
+    th, tw = template_size
+    half_h = max(1, th // 2)
+    half_w = max(1, tw // 2)
+    count = 0
+
+    while count < max_instances:
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        if max_val < threshold:
+            break
+        count += 1
+        result[max(0, y - half_h):y + half_h + 1, max(0, x - half_w):x + half_w + 1] = -1.0
+
+    return count
+
+
+# Shared by every profile's DetectionWatchdog worker and the Tk thread (invalidate_template)
+_template_cache = OrderedDict()
+_template_cache_lock = threading.Lock()
+
+
+def load_template(template_path, scale=1.0):
+    """
+    Load a reference frame as grayscale, resized to the capture scale.
+
+    Cached by path, modification time and scale, so a reference is only read and resized
+    again after it has been re-captured.
+    """
+    try:
+        key = (template_path, os.path.getmtime(template_path), scale)
+    except OSError:
         raise RuntimeError("Failed to load template image for comparison.")
 
+    with _template_cache_lock:
+        template = _template_cache.get(key)
+    if template is None:
+        template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+        if template is None:
+            raise RuntimeError("Failed to load template image for comparison.")
+        if scale != 1.0:
+            th, tw = template.shape[:2]
+            size = (max(1, int(round(tw * scale))), max(1, int(round(th * scale))))
+            template = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+        with _template_cache_lock:
+            _template_cache[key] = template
+            while len(_template_cache) > TEMPLATE_CACHE_SIZE:
+                _template_cache.popitem(last=False)
+
+    return template
+
+
+def invalidate_template(template_path):
+    """Drop every cached scale of a reference that changed on disk."""
+    with _template_cache_lock:
+        for key in [key for key in _template_cache if key[0] == template_path]:
+            del _template_cache[key]
+
+
+class FrameBufferPool:
+    """
+    Arrays reused by compare_images across ticks: the grayscale frame and the correlation map.
+
+    OpenCV writes into them through its dst/result parameters, so they are only reallocated
+    when the capture or reference size changes. Not thread-safe; use one pool per thread.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+        self.allocations = 0
+        self.peak_bytes = 0
+
+    def get(self, name, shape, dtype):
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            # Drop the old array first so the peak reflects what is actually held
+            self._buffers.pop(name, None)
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+            self.allocations += 1
+            self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        return buffer
+
+    @property
+    def current_bytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def describe(self):
+        return (
+            f"Frame buffers: {self.current_bytes / 1048576:.1f} MB "
+            f"(peak {self.peak_bytes / 1048576:.1f} MB, {self.allocations} allocations)"
+        )
+
+
+def compare_images(screenshot_image, template_path, threshold=0.90, count_instances=False, scale=1.0, pool=None):
+    """
+    Search the screenshot for the template.
+
+    Returns (is_match, max_val). With count_instances=True the first item is instead the
+    number of separate matches in the frame (0 when there is no match). scale is the
+    capture scale of the screenshot; the template is resized to match. With a
+    FrameBufferPool the grayscale frame and correlation map are written into reused arrays.
+    """
+    screenshot_rgba = np.asarray(screenshot_image)
+    if pool is None:
+        screenshot_gray = cv2.cvtColor(screenshot_rgba, cv2.COLOR_RGBA2GRAY)
+    else:
+        gray_buffer = pool.get("gray", screenshot_rgba.shape[:2], np.uint8)
+        screenshot_gray = cv2.cvtColor(screenshot_rgba, cv2.COLOR_RGBA2GRAY, dst=gray_buffer)
+    template = load_template(template_path, scale)
+
     sh, sw = screenshot_gray.shape[:2]
     th, tw = template.shape[:2]
 
     if th > sh or tw > sw:
-        return False, 0.0
+        return (0 if count_instances else False), 0.0
 
-    result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
+    if pool is None:
+        result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
+    else:
+        result_buffer = pool.get("correlation", (sh - th + 1, sw - tw + 1), np.float32)
+        result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED, result=result_buffer)
     _, max_val, _, _ = cv2.minMaxLoc(result)
-    return max_val >= threshold, max_val
 
+    if not count_instances:
+        return max_val >= threshold, max_val
 
-def increment_number_in_file(file_path, increment_amount):
+    if max_val < threshold:
+        return 0, max_val
+
+    # Reuse the correlation map that was already computed for the single best match
+    return count_match_instances(result, threshold, (th, tw)), max_val
+
+
+def _read_counter_text(file_path):
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read().strip()
+    return int(content) if content else 0
 
-    if not content:
-        number = 0
-    else:
-        number = int(content)
 
-    number = max(0, number + increment_amount)
+class CounterStore:
+    """
+    In-memory value of a counter text file, written back to disk in the background.
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(str(number))
+    Changes are coalesced and flushed COUNTER_FLUSH_DELAY seconds after the last one, through
+    a temp file and os.replace so OBS never reads a half-written number. When something else
+    edits the file its mtime changes and the new value is picked up on the next access; any
+    increments that weren't flushed yet are applied on top of it.
+    """
 
-    return number
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._value = None
+        self._mtime = None
+        self._pending_delta = 0
+        self._pending_absolute = False
+        self._dirty = False
+        self._timer = None
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call callback() (from whichever thread made the change) whenever the value changes."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _notify(self):
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback()
+            except Exception:
+                pass
 
+    def _sync(self):
+        """
+        Load the file if it's new to us or was edited externally. Call with the lock held;
+        returns True if the value changed.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            if self._value is None:
+                raise
+            return False
+        if self._value is not None and mtime == self._mtime:
+            return False
 
-def read_number_from_file(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read().strip()
+        previous = self._value
+        disk_value = _read_counter_text(self.path)
+        if self._dirty and not self._pending_absolute:
+            self._value = max(0, disk_value + self._pending_delta)
+        elif not self._dirty:
+            self._value = disk_value
+        self._mtime = mtime
+        return previous is not None and self._value != previous
+
+    def get(self):
+        with self._lock:
+            changed = self._sync()
+            value = self._value
+        if changed:
+            self._notify()
+        return value
 
-    if not content:
-        return 0
+    def is_valid(self):
+        try:
+            self.get()
+            return True
+        except Exception:
+            return False
+
+    def add(self, delta):
+        """Add delta (never going below 0) and return the new value."""
+        with self._lock:
+            self._sync()
+            new_value = max(0, self._value + delta)
+            self._pending_delta += new_value - self._value
+            self._value = new_value
+            self._schedule_flush()
+        self._notify()
+        return new_value
+
+    def set(self, value):
+        with self._lock:
+            self._sync()
+            self._value = max(0, int(value))
+            self._pending_absolute = True
+            self._schedule_flush()
+            new_value = self._value
+        self._notify()
+        return new_value
+
+    def _schedule_flush(self):
+        self._dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(COUNTER_FLUSH_DELAY, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write the value now if it has unsaved changes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(str(self._value))
+                os.replace(temp_path, self.path)
+            except OSError:
+                # Some readers keep the file open without delete sharing; fall back to rewriting it
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                try:
+                    with open(self.path, "w", encoding="utf-8") as f:
+                        f.write(str(self._value))
+                except OSError:
+                    self._timer = threading.Timer(COUNTER_FLUSH_DELAY, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                    return
+            try:
+                self._mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                self._mtime = None
+            self._dirty = False
+            self._pending_delta = 0
+            self._pending_absolute = False
+
+
+_counter_stores = {}
+_counter_stores_lock = threading.Lock()
+
+
+def get_counter_store(file_path):
+    """Shared CounterStore for a counter file, so every reader sees the same value."""
+    key = os.path.normcase(os.path.abspath(file_path))
+    with _counter_stores_lock:
+        store = _counter_stores.get(key)
+        if store is None:
+            store = CounterStore(file_path)
+            _counter_stores[key] = store
+        return store
+
+
+def flush_counter_stores():
+    with _counter_stores_lock:
+        stores = list(_counter_stores.values())
+    for store in stores:
+        store.flush()
 
-    return int(content)
+
+atexit.register(flush_counter_stores)
 
 
 def is_counter_file_numeric(file_path):
+    return get_counter_store(file_path).is_valid()
+
+
+class FeatureMatcher:
+    """
+    ORB keypoint matcher used as a layout-tolerant alternative to compare_images.
+
+    Keypoints and descriptors of the reference are extracted once and cached until the
+    reference file changes, so each tick only pays for the frame. ORB's scale pyramid
+    tolerates OBS layout and crop changes that break pixel-aligned template matching.
+    """
+
+    def __init__(self):
+        self.reference_orb = cv2.ORB_create(nfeatures=FEATURE_REFERENCE_FEATURES)
+        self.frame_orb = cv2.ORB_create(nfeatures=FEATURE_FRAME_FEATURES)
+        self.matcher = cv2.BFMatcher(cv2.NORM_HAMMING)
+        self._reference_key = None
+        self._reference_keypoints = None
+        self._reference_descriptors = None
+
+    def _load_reference(self, template_path):
+        try:
+            key = (template_path, os.path.getmtime(template_path))
+        except OSError:
+            raise RuntimeError("Failed to load template image for comparison.")
+
+        if key != self._reference_key:
+            template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                raise RuntimeError("Failed to load template image for comparison.")
+            # References are small crops; without padding most of them falls inside ORB's border margin
+            pad = FEATURE_EDGE_PADDING
+            template = cv2.copyMakeBorder(template, pad, pad, pad, pad, cv2.BORDER_REPLICATE)
+            keypoints, descriptors = self.reference_orb.detectAndCompute(template, None)
+            self._reference_key = key
+            self._reference_keypoints = keypoints
+            self._reference_descriptors = descriptors
+
+        return self._reference_keypoints, self._reference_descriptors
+
+    def invalidate(self):
+        """Re-extract the reference keypoints on the next compare."""
+        self._reference_key = None
+
+    def compare(self, screenshot_image, template_path):
+        """Return (is_match, inlier_ratio, inliers) for the reference in the screenshot."""
+        ref_keypoints, ref_descriptors = self._load_reference(template_path)
+        if ref_descriptors is None or len(ref_keypoints) < FEATURE_MIN_INLIERS:
+            raise RuntimeError("Reference image has too little detail for feature matching.")
+
+        frame_gray = cv2.cvtColor(np.array(screenshot_image), cv2.COLOR_RGBA2GRAY)
+        frame_scale = 1.0
+        if frame_gray.shape[1] > FEATURE_MAX_FRAME_WIDTH:
+            frame_scale = FEATURE_MAX_FRAME_WIDTH / frame_gray.shape[1]
+            frame_gray = cv2.resize(frame_gray, None, fx=frame_scale, fy=frame_scale, interpolation=cv2.INTER_AREA)
+
+        frame_keypoints, frame_descriptors = self.frame_orb.detectAndCompute(frame_gray, None)
+        if frame_descriptors is None or len(frame_keypoints) < 2:
+            return False, 0.0, 0
+
+        good = []
+        for pair in self.matcher.knnMatch(ref_descriptors, frame_descriptors, k=2):
+            if len(pair) == 2 and pair[0].distance < FEATURE_RATIO_TEST * pair[1].distance:
+                good.append(pair[0])
+
+        if len(good) < FEATURE_MIN_INLIERS:
+            return False, 0.0, 0
+
+        src = np.float32([ref_keypoints[m.queryIdx].pt for m in good]).reshape(-1, 1, 2)
+        dst = np.float32([frame_keypoints[m.trainIdx].pt for m in good]).reshape(-1, 1, 2)
+        _, mask = cv2.findHomography(src, dst, cv2.RANSAC, 5.0)
+        if mask is None:
+            return False, 0.0, 0
+
+        inliers = int(mask.sum())
+        return inliers >= FEATURE_MIN_INLIERS, inliers / len(good), inliers
+
+
+def benchmark_match_methods(screenshot_image, template_path, threshold=0.90, runs=20):
+    """
+    Time compare_images against FeatureMatcher on the same frame.
+
+    Returns {method: {"match": bool, "confidence": float, "ms": float}} where ms is the
+    mean over `runs` calls (the feature reference is warmed up first, as it is cached
+    in normal use). A method that cannot run on the reference reports {"error": str}.
+    """
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        is_match, confidence = compare_images(screenshot_image, template_path, threshold=threshold)
+    results[MATCH_METHOD_TEMPLATE] = {
+        "match": bool(is_match),
+        "confidence": float(confidence),
+        "ms": (time.perf_counter() - start) * 1000 / runs,
+    }
+
+    matcher = FeatureMatcher()
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-        if not content:
-            return True
-        int(content)
+        matcher.compare(screenshot_image, template_path)
+    except RuntimeError as exc:
+        results[MATCH_METHOD_FEATURES] = {"error": str(exc)}
+        return results
+    start = time.perf_counter()
+    for _ in range(runs):
+        is_match, confidence, inliers = matcher.compare(screenshot_image, template_path)
+    results[MATCH_METHOD_FEATURES] = {
+        "match": bool(is_match),
+        "confidence": float(confidence),
+        "inliers": inliers,
+        "ms": (time.perf_counter() - start) * 1000 / runs,
+    }
+
+    return results
+
+
+class DetectionSettings:
+    """
+    Read-only snapshot of everything an auto tick needs, built on the Tk thread.
+
+    Changing a setting builds a new snapshot and swaps the profile's reference to it, so the
+    detection thread always sees one complete set of values and never has to call into Tk.
+    """
+
+    __slots__ = (
+        "title",
+        "frequency",
+        "cooldown",
+        "threshold",
+        "count_instances",
+        "match_method",
+        "image_path",
+        "capture_client_only",
+        "capture_crop",
+        "capture_scale",
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DetectionSettings is read-only, build a new one instead")
+
+    def __delattr__(self, name):
+        raise AttributeError("DetectionSettings is read-only, build a new one instead")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"DetectionSettings({fields})"
+
+
+class DetectionWatchdog:
+    """
+    Runs capture and match jobs off the Tk thread, each under a deadline.
+
+    A hung PrintWindow can't be interrupted, so a job that overruns is abandoned: it is
+    counted as a stall, its result is dropped when it finally returns, and no new job is
+    started until its thread is free. Every consecutive stall doubles the poll interval;
+    after WATCHDOG_DEGRADE_AFTER of them polling drops to WATCHDOG_DEGRADED_INTERVAL until
+    a job finishes in time again. Callbacks always run on the Tk thread.
+    """
+
+    def __init__(self, widget, deadline=WATCHDOG_DEADLINE_SECONDS):
+        self.widget = widget
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self._busy = False
+        self.consecutive_stalls = 0
+        self.total_stalls = 0
+        self.skipped_ticks = 0
+        self.last_stall_seconds = 0.0
+        self.longest_stall_seconds = 0.0
+        self.stall_in_progress = False
+        self.degraded = False
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._busy
+
+    def reset_backoff(self):
+        self.consecutive_stalls = 0
+        self.degraded = False
+
+    def next_interval(self, interval):
+        """Seconds until the next tick, given the profile's normal check frequency."""
+        if self.degraded:
+            return max(interval, WATCHDOG_DEGRADED_INTERVAL)
+        return interval * (2 ** min(self.consecutive_stalls, WATCHDOG_MAX_BACKOFF_STEPS))
+
+    def submit(self, job, on_done, on_error=None, on_stall=None):
+        """
+        Run job() on a worker thread. on_done(result) or on_error(exc) is called if it finishes
+        before the deadline, on_stall() if it doesn't. Returns False (and counts a skipped tick)
+        while an abandoned job is still running.
+        """
+        with self._lock:
+            if self._busy:
+                self.skipped_ticks += 1
+                return False
+            self._busy = True
+
+        state = {"done": False, "abandoned": False}
+        started = time.monotonic()
+
+        def worker():
+            try:
+                state["result"] = job()
+            except Exception as exc:
+                state["error"] = exc
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self._busy = False
+                    state["done"] = True
+                    if state["abandoned"]:
+                        self.stall_in_progress = False
+                        self.last_stall_seconds = elapsed
+                        self.longest_stall_seconds = max(self.longest_stall_seconds, elapsed)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self._poll(state, started, on_done, on_error, on_stall)
         return True
-    except Exception:
-        return False
+
+    def _poll(self, state, started, on_done, on_error, on_stall):
+        with self._lock:
+            done = state["done"]
+            if not done and time.monotonic() - started > self.deadline:
+                state["abandoned"] = True
+                self.stall_in_progress = True
+
+        if done:
+            self.reset_backoff()
+            if "error" in state:
+                if on_error:
+                    on_error(state["error"])
+            else:
+                on_done(state["result"])
+            return
+
+        if state["abandoned"]:
+            self.total_stalls += 1
+            self.consecutive_stalls += 1
+            if self.consecutive_stalls >= WATCHDOG_DEGRADE_AFTER:
+                self.degraded = True
+            if on_stall:
+                on_stall()
+            return
+
+        try:
+            self.widget.after(WATCHDOG_POLL_MS, self._poll, state, started, on_done, on_error, on_stall)
+        except tk.TclError:
+            # The widget was destroyed (e.g. Test Image closed); nobody is waiting for the result
+            pass
+
+    def describe(self):
+        """Stall counters as display lines for the diagnostics view."""
+        with self._lock:
+            last = self.last_stall_seconds
+            longest = self.longest_stall_seconds
+            in_progress = self.stall_in_progress
+
+        if self.degraded:
+            polling = f"degraded (every {WATCHDOG_DEGRADED_INTERVAL:.0f} s)"
+        elif self.consecutive_stalls:
+            polling = f"backed off x{2 ** min(self.consecutive_stalls, WATCHDOG_MAX_BACKOFF_STEPS)}"
+        else:
+            polling = "normal"
+
+        stall_text = f"Stalls: {self.total_stalls}"
+        if in_progress:
+            stall_text += " (one still running)"
+        elif self.total_stalls:
+            stall_text += f" (last {last:.1f} s, longest {longest:.1f} s)"
+
+        return [stall_text, f"Skipped ticks: {self.skipped_ticks}", f"Polling: {polling}"]
+
+
+# =========================
+# ENCOUNTER HISTORY
+# =========================
+HISTORY_BATCH_SIZE = 200      # Most encounters written in one transaction
+HISTORY_BATCH_DELAY = 0.5     # Seconds to wait for more encounters before writing a batch
+
+
+class EncounterHistory:
+    """
+    Local SQLite log of every counter change, grouped into phases.
+
+    A phase is the stretch of a hunt between two counter resets; resetting a counter ends
+    the profile's phase with its final count and the next encounter starts a new one.
+    Callers only put rows on a queue, a writer thread inserts them in batches, so recording
+    never waits on the disk.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS phases (
+            id INTEGER PRIMARY KEY,
+            profile INTEGER NOT NULL,
+            started REAL NOT NULL,
+            ended REAL,
+            final_count INTEGER,
+            game TEXT,
+            target TEXT
+        );
+        CREATE TABLE IF NOT EXISTS encounters (
+            id INTEGER PRIMARY KEY,
+            phase INTEGER NOT NULL REFERENCES phases(id),
+            profile INTEGER NOT NULL,
+            ts REAL NOT NULL,
+            source TEXT NOT NULL,
+            delta INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            confidence REAL,
+            game TEXT,
+            target TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_encounters_phase_ts ON encounters(phase, ts);
+        CREATE INDEX IF NOT EXISTS idx_encounters_profile_ts ON encounters(profile, ts);
+        CREATE INDEX IF NOT EXISTS idx_phases_profile_open ON phases(profile, ended);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.dropped = 0
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer, daemon=True)
+                self._thread.start()
+
+    def record(self, profile_index, source, delta, count, confidence=None, game="", target=""):
+        """Queue one counter change; source is "auto", "manual" or "hotkey"."""
+        self._ensure_started()
+        self._queue.put(("encounter", (profile_index, time.time(), source, delta, count, confidence, game, target)))
+
+    def archive_phase(self, profile_index, final_count):
+        """End the profile's current phase (e.g. before its counter is reset)."""
+        self._ensure_started()
+        self._queue.put(("archive", (profile_index, time.time(), final_count)))
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _writer(self):
+        try:
+            conn = sqlite3.connect(self.path)
+            conn.executescript(self.SCHEMA)
+        except sqlite3.Error:
+            # History is optional; keep draining the queue so callers are never affected
+            while self._queue.get() is not None:
+                self.dropped += 1
+            return
+
+        open_phases = {}
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + HISTORY_BATCH_DELAY
+            while batch[-1] is not None and len(batch) < HISTORY_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                running = False
+
+            try:
+                with conn:
+                    for kind, values in batch:
+                        if kind == "encounter":
+                            self._insert_encounter(conn, open_phases, values)
+                        else:
+                            self._archive(conn, open_phases, values)
+            except sqlite3.Error:
+                self.dropped += len(batch)
+
+        conn.close()
+
+    def _phase_id(self, conn, open_phases, profile_index, ts, game, target):
+        phase_id = open_phases.get(profile_index)
+        if phase_id is None:
+            row = conn.execute(
+                "SELECT id FROM phases WHERE profile = ? AND ended IS NULL ORDER BY id DESC LIMIT 1",
+                (profile_index,)
+            ).fetchone()
+            if row:
+                phase_id = row[0]
+            else:
+                phase_id = conn.execute(
+                    "INSERT INTO phases (profile, started, game, target) VALUES (?, ?, ?, ?)",
+                    (profile_index, ts, game, target)
+                ).lastrowid
+            open_phases[profile_index] = phase_id
+        return phase_id
+
+    def _insert_encounter(self, conn, open_phases, values):
+        profile_index, ts, source, delta, count, confidence, game, target = values
+        phase_id = self._phase_id(conn, open_phases, profile_index, ts, game, target)
+        conn.execute(
+            "INSERT INTO encounters (phase, profile, ts, source, delta, count, confidence, game, target) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (phase_id, profile_index, ts, source, delta, count, confidence, game, target)
+        )
+
+    def _archive(self, conn, open_phases, values):
+        profile_index, ts, final_count = values
+        open_phases.pop(profile_index, None)
+        conn.execute(
+            "UPDATE phases SET ended = ?, final_count = ? WHERE profile = ? AND ended IS NULL",
+            (ts, final_count, profile_index)
+        )
+
+
+ENCOUNTER_HISTORY = EncounterHistory(HISTORY_DB_PATH)
+atexit.register(ENCOUNTER_HISTORY.close)
 
 
 # =========================
@@ -1556,36 +3039,23 @@ def hotkey_display_to_keyboard(hotkey):
 
 def load_hotkeys_config():
     hotkeys = DEFAULT_HOTKEYS.copy()
-    global_enabled = False
+    section = SETTINGS.hotkeys
+    global_enabled = section.get_value("global_enabled", False)
 
-    if not os.path.exists(HOTKEYS_CONFIG_PATH):
-        return hotkeys, global_enabled
-
-    with open(HOTKEYS_CONFIG_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-            if key == "global_enabled":
-                global_enabled = (value == "1")
-            elif key in hotkeys:
-                if value:
-                    hotkeys[key] = normalize_hotkey_display(value)
+    for key in hotkeys:
+        value = section.get(key, "").strip()
+        if value:
+            hotkeys[key] = normalize_hotkey_display(value)
 
     return hotkeys, global_enabled
 
 
 def save_hotkeys_config(hotkeys, global_enabled):
-    lines = [
-        f"global_enabled: {'1' if global_enabled else '0'}\n",
-    ]
+    section = SETTINGS.hotkeys
+    section.set("global_enabled", bool(global_enabled))
     for key in ("start_stop", "capture"):
-        lines.append(f"{key}: {hotkeys.get(key, '')}\n")
-
-    with open(HOTKEYS_CONFIG_PATH, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        section.set(key, hotkeys.get(key, ""))
+    SETTINGS.flush()
 
 
 # =========================
@@ -1660,97 +3130,456 @@ def rpc_write_config(path, cfg):
         f.writelines(lines)
 
 
+# Highest national dex number of each generation; anything above the last one is generation 9
+GENERATION_LAST_DEX = (151, 251, 386, 493, 649, 721, 809, 905)
+MAX_GENERATION = len(GENERATION_LAST_DEX) + 1
+
+
+class GameCatalog:
+    """
+    Index of the rpc_config/*.txt game files, parsed once and saved as a compact JSON index.
+
+    The first refresh after startup stats every file and only re-parses the ones whose size
+    or mtime changed since the saved index. After that a refresh is a single stat of the
+    folder: files are only listed again when its mtime changes (a game added, removed or
+    renamed). Writes made through rpc_save_game_config update the index directly.
+    """
+
+    INDEX_VERSION = 2
+
+    def __init__(self, folder, index_path):
+        self.folder = folder
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._games = None        # game_id -> {"mtime": ns, "size": bytes, "generation": 1-9, "config": cfg}
+        self._folder_mtime = None
+        self._verified = False    # Every file checked against the index since startup
+
+    @staticmethod
+    def _parse(path, stat):
+        cfg = rpc_read_config(path)
+        try:
+            generation = max(1, min(MAX_GENERATION, int(cfg.get("generation", MAX_GENERATION))))
+        except (ValueError, TypeError):
+            generation = MAX_GENERATION
+        return {"mtime": stat.st_mtime_ns, "size": stat.st_size, "generation": generation, "config": cfg}
+
+    def _load_index(self):
+        self._games = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == self.INDEX_VERSION and isinstance(index.get("games"), dict):
+                self._games = index["games"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _save_index(self):
+        index = {"version": self.INDEX_VERSION, "games": self._games}
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            pass
+
+    def refresh(self):
+        with self._lock:
+            if self._games is None:
+                self._load_index()
+            try:
+                folder_mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                self._games = {}
+                self._folder_mtime = None
+                return
+            if self._verified and folder_mtime == self._folder_mtime:
+                return
+
+            changed = False
+            games = {}
+            for fname in sorted(os.listdir(self.folder)):
+                if not fname.endswith(".txt"):
+                    continue
+                game_id = fname[:-4]
+                path = os.path.join(self.folder, fname)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entry = self._games.get(game_id)
+                if entry is None or entry.get("mtime") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+                    try:
+                        entry = self._parse(path, stat)
+                    except Exception:
+                        continue
+                    changed = True
+                games[game_id] = entry
+            if changed or set(games) != set(self._games):
+                self._games = games
+                self._save_index()
+            self._folder_mtime = folder_mtime
+            self._verified = True
+
+    def game_ids(self):
+        """Games that have an application ID, i.e. can be broadcast."""
+        self.refresh()
+        with self._lock:
+            return [game_id for game_id, entry in self._games.items() if entry["config"].get("application_id") is not None]
+
+    def get(self, game_id):
+        """A copy of the game's config; raises FileNotFoundError for unknown games."""
+        self.refresh()
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is None:
+                raise FileNotFoundError(os.path.join(self.folder, f"{game_id}.txt"))
+            return dict(entry["config"])
+
+    def generation(self, game_id):
+        """Highest Pokemon generation available in the game (all of them for unknown games)."""
+        self.refresh()
+        with self._lock:
+            entry = self._games.get(game_id)
+            return entry["generation"] if entry is not None else MAX_GENERATION
+
+    def put(self, game_id, cfg):
+        path = os.path.join(self.folder, f"{game_id}.txt")
+        rpc_write_config(path, cfg)
+        with self._lock:
+            if self._games is None:
+                self._load_index()
+            try:
+                entry = self._parse(path, os.stat(path))
+            except OSError:
+                return
+            self._games[game_id] = entry
+            self._save_index()
+
+
+GAME_CATALOG = GameCatalog(RPC_CONFIG_FOLDER, GAME_CATALOG_INDEX_PATH)
+
+
+def rpc_get_game_config(game_id):
+    return GAME_CATALOG.get(game_id)
+
+
+def rpc_save_game_config(game_id, cfg):
+    GAME_CATALOG.put(game_id, cfg)
+
+
 def rpc_find_game_configs():
-    games = []
-    if not os.path.isdir(RPC_CONFIG_FOLDER):
-        return games
+    return GAME_CATALOG.game_ids()
 
-    for fname in os.listdir(RPC_CONFIG_FOLDER):
-        if not fname.endswith(".txt"):
-            continue
-        path = os.path.join(RPC_CONFIG_FOLDER, fname)
+
+def pokemon_generation_end(pokemon_ids, generation):
+    """Number of leading Pokemon in the id-sorted list that exist up to the given generation."""
+    if generation >= MAX_GENERATION:
+        return len(pokemon_ids)
+    return bisect.bisect_right(pokemon_ids, GENERATION_LAST_DEX[max(1, generation) - 1])
+
+
+class PokemonDataset:
+    """
+    The Pokemon list as parallel columns sorted by dex number, shared by every RPC options view.
+    generation_ends[g - 1] is how many leading entries exist up to generation g.
+    """
+
+    __slots__ = ("ids", "names", "formatted", "icon_paths", "generation_ends")
+
+    def __init__(self, ids=(), names=(), icon_paths=()):
+        self.ids = tuple(ids)
+        self.names = tuple(names)
+        self.formatted = tuple(name.replace("-", " ").title() for name in self.names)
+        self.icon_paths = tuple(icon_paths)
+        self.generation_ends = tuple(
+            pokemon_generation_end(self.ids, generation) for generation in range(1, MAX_GENERATION + 1)
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def generation_end(self, generation):
+        return self.generation_ends[max(1, min(MAX_GENERATION, generation)) - 1]
+
+    def rows(self):
+        """Fresh per-view row dicts, in dataset order."""
+        return [
+            {'original': name, 'formatted': formatted, 'icon_path': icon_path, 'id': pokemon_id}
+            for pokemon_id, name, formatted, icon_path in zip(self.ids, self.names, self.formatted, self.icon_paths)
+        ]
+
+
+_POKEMON_DATASET = None
+_POKEMON_DATASET_LOCK = threading.Lock()
+
+
+def _read_pokemon_dataset():
+    """Parse json/pokemon_gen1_9.json and match each Pokemon to its {id}_{name}.png icon."""
+    json_path = resource_path(os.path.join("json", "pokemon_gen1_9.json"))
+    if not os.path.exists(json_path):
+        return PokemonDataset()
+    with open(json_path, 'r', encoding='utf-8') as f:
+        pokemon_data = json.load(f)
+
+    # Handle different JSON structures
+    all_pokemon = []
+    if isinstance(pokemon_data, dict):
+        # JSON is organized by generation: {"generation_1": [...], "generation_2": [...]}
+        for gen_pokemon in pokemon_data.values():
+            if isinstance(gen_pokemon, list):
+                all_pokemon.extend(gen_pokemon)
+    elif isinstance(pokemon_data, list):
+        # JSON is a flat list: [{...}, {...}]
+        all_pokemon = pokemon_data
+
+    # Filter out non-dictionary items (strings, nulls, etc.) and sort by id
+    valid_pokemon = [p for p in all_pokemon if isinstance(p, dict) and p.get('name')]
+    sorted_pokemon = sorted(valid_pokemon, key=lambda x: x.get('id', 0))
+
+    # One directory listing instead of an exists() check per Pokemon
+    try:
+        icon_files = {fname.lower(): fname for fname in os.listdir(POKEMON_ICONS_FOLDER)}
+    except OSError:
+        icon_files = {name: name for name in POKEMON_SPRITE_ATLAS.names()}
+
+    ids, names, icon_paths = [], [], []
+    for pokemon in sorted_pokemon:
+        pokemon_id = pokemon.get('id', 0)
+        pokemon_name = pokemon.get('name', '')
+        icon_filename = icon_files.get(f"{pokemon_id}_{pokemon_name}.png".lower()) if pokemon_id else None
+        ids.append(pokemon_id)
+        names.append(pokemon_name)
+        icon_paths.append(os.path.join(POKEMON_ICONS_FOLDER, icon_filename) if icon_filename else "")
+    return PokemonDataset(ids, names, icon_paths)
+
+
+def load_pokemon_dataset():
+    """The process-wide PokemonDataset; the first caller loads it, later callers get it instantly."""
+    global _POKEMON_DATASET
+    with _POKEMON_DATASET_LOCK:
+        if _POKEMON_DATASET is None:
+            try:
+                _POKEMON_DATASET = _read_pokemon_dataset()
+            except Exception as e:
+                print(f"WARNING: Could not load Pokemon list: {e}")
+                import traceback
+                traceback.print_exc()
+                _POKEMON_DATASET = PokemonDataset()
+        return _POKEMON_DATASET
+
+
+def preload_pokemon_dataset():
+    threading.Thread(target=load_pokemon_dataset, daemon=True).start()
+
+
+class SpriteAtlas:
+    """
+    Read side of the sprite atlas written by write_sprite_atlas(): every sprite's PNG bytes
+    in one memory-mapped file, found through an offset index, so no sprite needs its own
+    open. The atlas is ignored (and callers fall back to the loose files) when it is missing
+    or unreadable.
+
+    Staleness is checked per sprite against one listing of the source folder: a sprite is
+    only sliced out of the atlas while a loose file of that name and size exists, so copies,
+    zip extracts and PyInstaller's unpack folder (all fresh mtimes) keep using the atlas,
+    while replaced sprites fall back to their file. An edit that keeps the exact byte size
+    goes unnoticed; rebuild the atlas after changing sprites. Without the source folder
+    (an atlas-only install) every sprite in the atlas is used.
+    """
+
+    MAGIC = b"RCSA"
+    VERSION = 2
+    HEADER = struct.Struct("<4sII")  # magic, version, index length
+
+    def __init__(self, path, source_folder):
+        self.path = path
+        self.source_folder = source_folder
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._map = None
+        self._index = {}          # lowercased file name -> (offset, length)
+        self._data_offset = 0
+
+    def _open(self):
+        with self._lock:
+            if self._loaded:
+                return self._map is not None
+            self._loaded = True
+            try:
+                with open(self.path, "rb") as f:
+                    atlas_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return False
+            try:
+                magic, version, index_length = self.HEADER.unpack_from(atlas_map, 0)
+                if magic != self.MAGIC or version != self.VERSION:
+                    raise ValueError("not a sprite atlas")
+                start = self.HEADER.size
+                index = json.loads(atlas_map[start:start + index_length].decode("utf-8"))
+                sprites = {name: tuple(entry) for name, entry in index["sprites"].items()}
+                loose_sizes = self._loose_sizes()
+                if loose_sizes is not None:
+                    # Sprites are stored byte for byte, so the slice length is the file size
+                    sprites = {
+                        name: entry for name, entry in sprites.items()
+                        if loose_sizes.get(name) == entry[1]
+                    }
+                self._index = sprites
+                self._data_offset = start + index_length
+                self._map = atlas_map
+            except (ValueError, KeyError, TypeError, struct.error):
+                atlas_map.close()
+                return False
+            return True
+
+    def _loose_sizes(self):
+        """Lowercased file name -> size of the loose sprites, or None without a source folder."""
         try:
-            with open(path, "r", encoding="cp1252") as f:
-                contents = f.read().lower()
-                if "application_id:" in contents:
-                    games.append(fname[:-4])
-        except Exception:
+            # scandir's stat comes with the listing on Windows, so this is one pass, not a stat per file
+            with os.scandir(self.source_folder) as entries:
+                return {
+                    entry.name.lower(): entry.stat().st_size
+                    for entry in entries if entry.name.lower().endswith(".png")
+                }
+        except OSError:
+            return None
+
+    def names(self):
+        return list(self._index) if self._open() else []
+
+    def image(self, path):
+        """The sprite stored for this file path as a PIL image, or None if the atlas doesn't have it."""
+        if not self._open():
+            return None
+        entry = self._index.get(os.path.basename(path).lower())
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._data_offset + offset
+        try:
+            image = Image.open(io.BytesIO(self._map[start:start + length]))
+            image.load()
+        except OSError:
+            return None
+        return image
+
+
+def write_sprite_atlas(source_folder, path):
+    """Pack every PNG in source_folder into a sprite atlas at path; returns (sprite count, bytes written)."""
+    sprites = {}
+    blobs = []
+    offset = 0
+    for fname in sorted(os.listdir(source_folder)):
+        if not fname.lower().endswith(".png"):
             continue
-    return games
+        with open(os.path.join(source_folder, fname), "rb") as f:
+            blob = f.read()
+        sprites[fname.lower()] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
 
+    index = json.dumps(
+        {"sprites": sprites}, separators=(",", ":")
+    ).encode("utf-8")
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(SpriteAtlas.HEADER.pack(SpriteAtlas.MAGIC, SpriteAtlas.VERSION, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(temp_path, path)
+    return len(sprites), SpriteAtlas.HEADER.size + len(index) + offset
 
-def rpc_load_pokemon_list():
-    """Load Pokemon names, IDs, and icons from JSON files, sorted by id.
-    
-    Returns:
-        list: List of tuples (pokemon_name, pokemon_id, icon_data) or (pokemon_name, pokemon_id) if no icons
+
+POKEMON_SPRITE_ATLAS = SpriteAtlas(POKEMON_SPRITE_ATLAS_PATH, POKEMON_ICONS_FOLDER)
+
+
+POKEMON_SPRITE_CACHE_SIZE = 24  # Sprites kept decoded; the grid only shows 3 at a time
+POKEMON_SPRITE_PREFETCH = 6     # Results past the visible ones decoded ahead by the worker
+GAME_ICON_CACHE_SIZE = 64
+
+
+class ImageCache:
     """
-    try:
-        # Load Pokemon names from pokemon_gen1_9.json
-        json_path = resource_path(os.path.join("json", "pokemon_gen1_9.json"))
-        pokemon_names = []
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                pokemon_data = json.load(f)
-                
-                # Handle different JSON structures
-                all_pokemon = []
-                if isinstance(pokemon_data, dict):
-                    # JSON is organized by generation: {"generation_1": [...], "generation_2": [...]}
-                    for gen_key, gen_pokemon in pokemon_data.items():
-                        if isinstance(gen_pokemon, list):
-                            all_pokemon.extend(gen_pokemon)
-                elif isinstance(pokemon_data, list):
-                    # JSON is a flat list: [{...}, {...}]
-                    all_pokemon = pokemon_data
-                else:
-                    return []
-                
-                # Filter out non-dictionary items (strings, nulls, etc.)
-                valid_pokemon = [p for p in all_pokemon if isinstance(p, dict) and p.get('name')]
-                
-                # Sort by id and extract names only
-                sorted_pokemon = sorted(valid_pokemon, key=lambda x: x.get('id', 0))
-                pokemon_names = [p.get('name', '') for p in sorted_pokemon]
-        if not pokemon_names:
-            return []
-
-        # Load icons directly from assets/pokemon_icons/ directory
-        icons_dir = resource_path(os.path.join("assets", "pokemon_icons"))
-        icon_map = {}
-        
-        if os.path.exists(icons_dir) and os.path.isdir(icons_dir):
-            # Build icon paths from sorted_pokemon (has both id and name)
-            for pokemon in sorted_pokemon:
-                pokemon_id = pokemon.get('id', 0)
-                pokemon_name = pokemon.get('name', '')
-                if pokemon_id and pokemon_name:
-                    # Icons are named: {id}_{name}.png
-                    icon_filename = f"{pokemon_id}_{pokemon_name}.png"
-                    icon_path = os.path.join(icons_dir, icon_filename)
-                    
-                    # Check if icon file exists
-                    if os.path.exists(icon_path):
-                        # Store relative path from root for load_pokemon_icon()
-                        icon_map[pokemon_name.lower()] = os.path.join("assets", "pokemon_icons", icon_filename)
-            
-        # Return list of tuples (name, id, icon_path) if icons available, else (name, id)
-        if icon_map:
-            result = []
-            for pokemon in sorted_pokemon:
-                pokemon_id = pokemon.get('id', 0)
-                pokemon_name = pokemon.get('name', '')
-                icon_path = icon_map.get(pokemon_name.lower(), '')
-                result.append((pokemon_name, pokemon_id, icon_path))
-            return result
-        return [(p.get('name', ''), p.get('id', 0)) for p in sorted_pokemon]
-            
-    except Exception as e:
-        print(f"WARNING: Could not load Pokemon list: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    return []  # Return empty list if file not found or error occurred
+    LRU of Tk PhotoImages decoded from image files, optionally resized. With an atlas,
+    files are sliced out of it first and only read from disk when it doesn't have them.
+
+    prefetch() hands paths to a worker thread that decodes them with PIL ahead of time;
+    the PhotoImage itself is only created in photo(), which must run on the Tk thread.
+    Views keep their own references to the images they currently show, so an image
+    evicted here is never pulled out from under a canvas or tree.
+    """
+
+    def __init__(self, capacity, size=None, atlas=None):
+        self.capacity = capacity
+        self.size = size
+        self.atlas = atlas
+        self._photos = OrderedDict()   # path -> PhotoImage (Tk thread only)
+        self._decoded = OrderedDict()  # path -> PIL image, filled by the worker
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def _decode(self, path):
+        image = self.atlas.image(path) if self.atlas is not None else None
+        if image is None:
+            image = Image.open(path)
+        if self.size:
+            return image.resize(self.size, Image.LANCZOS)
+        image.load()
+        return image
+
+    def photo(self, path):
+        if not path:
+            return None
+        photo = self._photos.get(path)
+        if photo is not None:
+            self._photos.move_to_end(path)
+            return photo
+
+        with self._lock:
+            image = self._decoded.pop(path, None)
+        try:
+            if image is None:
+                image = self._decode(path)
+            photo = ImageTk.PhotoImage(image)
+        except Exception:
+            return None
+
+        self._photos[path] = photo
+        while len(self._photos) > self.capacity:
+            self._photos.popitem(last=False)
+        return photo
+
+    def prefetch(self, paths):
+        pending = [path for path in paths if path and path not in self._photos]
+        if not pending:
+            return
+        self._queue.put(pending)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def _worker(self):
+        while True:
+            for path in self._queue.get():
+                with self._lock:
+                    if path in self._decoded:
+                        continue
+                try:
+                    image = self._decode(path)
+                except Exception:
+                    continue
+                with self._lock:
+                    self._decoded[path] = image
+                    while len(self._decoded) > self.capacity:
+                        self._decoded.popitem(last=False)
+
+
+POKEMON_SPRITES = ImageCache(POKEMON_SPRITE_CACHE_SIZE, atlas=POKEMON_SPRITE_ATLAS)
+GAME_ICONS = ImageCache(GAME_ICON_CACHE_SIZE, size=(RPC_ICON_SIZE, RPC_ICON_SIZE))
 
 
 def rpc_open_options(profile, parent_grab=None):
@@ -1854,19 +3683,16 @@ def rpc_open_options(profile, parent_grab=None):
     for game_id in rpc_find_game_configs():
         display_name = game_id
         icon_image = None
-        config_path = os.path.join(RPC_CONFIG_FOLDER, f"{game_id}.txt")
 
         try:
-            cfg = rpc_read_config(config_path)
+            cfg = rpc_get_game_config(game_id)
             if cfg.get("game"):
                 display_name = cfg["game"]
 
             icon_name = cfg.get("icon", "")
             if icon_name:
-                icon_path = os.path.join(SCRIPT_FOLDER, "assets", "game_icon", f"{icon_name}.png")
-                if os.path.isfile(icon_path):
-                    image = Image.open(icon_path).resize((RPC_ICON_SIZE, RPC_ICON_SIZE), Image.LANCZOS)
-                    icon_image = ImageTk.PhotoImage(image)
+                icon_image = GAME_ICONS.photo(os.path.join(SCRIPT_FOLDER, "assets", "game_icon", f"{icon_name}.png"))
+                if icon_image:
                     win.rpc_icons.append(icon_image)
         except Exception:
             pass
@@ -1897,115 +3723,25 @@ def rpc_open_options(profile, parent_grab=None):
     populate_tree()
     
     # Bind filter
-    filter_entry.bind("<KeyRelease>", on_filter_change)
-
-    if profile.rpc_game_id:
-        try:
-            tree.selection_set(profile.rpc_game_id)
-            tree.see(profile.rpc_game_id)
-        except Exception:
-            pass  # Item might be filtered out
-
-    # Load Pokemon list for Target selector
-    pokemon_list_raw = rpc_load_pokemon_list()
-    
-    # Format Pokemon names: replace "-" with " " and title case
-    def format_pokemon_name(name):
-        """Format Pokemon name: replace hyphens with spaces and title case"""
-        return name.replace("-", " ").title()
-    
-    def load_pokemon_icon(icon_data):
-        """Load Pokemon icon from URL, base64, or local path"""
-        if not icon_data:
-            return None
-        
-        try:
-            from io import BytesIO
-            import base64
-            
-            # Check if it's a data URI (base64)
-            if icon_data.startswith('data:image'):
-                # Extract base64 data
-                base64_data = icon_data.split(',', 1)[1] if ',' in icon_data else icon_data
-                image_data = base64.b64decode(base64_data)
-                image = Image.open(BytesIO(image_data))
-            # Check if it's a URL
-            elif icon_data.startswith('http://') or icon_data.startswith('https://'):
-                import urllib.request
-                with urllib.request.urlopen(icon_data, timeout=2) as response:
-                    image_data = response.read()
-                    image = Image.open(BytesIO(image_data))
-            # Assume it's a local file path
-            else:
-                icon_path = resource_path(icon_data)
-                if os.path.exists(icon_path):
-                    image = Image.open(icon_path)
-                else:
-                    return None
-            
-            # Resize to 32x32 for tree display
-            image = image.resize((32, 32), Image.LANCZOS)
-            return ImageTk.PhotoImage(image)
-        except Exception:
-            return None
-    
-    def load_pokemon_sprite(pokemon_name, pokemon_id):
-        """Load Pokemon sprite from assets/pokemon_icons/ and scale to 80x80"""
-        if not pokemon_name or not pokemon_id:
-            return None
-        
+    filter_entry.bind("<KeyRelease>", on_filter_change)
+
+    if profile.rpc_game_id:
         try:
-            # Sprites are named: {id}_{name}.png in assets/pokemon_icons/
-            sprite_filename = f"{pokemon_id}_{pokemon_name}.png"
-            sprite_path = resource_path(os.path.join("assets", "pokemon_icons", sprite_filename))
-            
-            if os.path.exists(sprite_path):
-                image = Image.open(sprite_path)
-                # Keep original 128x128 size (no scaling)
-                return ImageTk.PhotoImage(image)
-            else:
-                return None
+            tree.selection_set(profile.rpc_game_id)
+            tree.see(profile.rpc_game_id)
         except Exception:
-            return None
-    
-    # Store both original and formatted names, icons, sprites, and IDs
-    win.pokemon_data = []
-    win.pokemon_icons = []  # Keep references to prevent garbage collection
-    win.pokemon_grid_sprites = []  # Keep sprite references for grid
+            pass  # Item might be filtered out
+
+    # Pokemon list for Target selector (preloaded at startup)
+    win.pokemon_dataset = load_pokemon_dataset()
     
-    # Check if pokemon_list_raw contains tuples with icons (3-tuples)
-    try:
-        has_icons = (pokemon_list_raw and isinstance(pokemon_list_raw[0], tuple) and 
-                     len(pokemon_list_raw[0]) == 3)
-    except (IndexError, TypeError):
-        has_icons = False
+    # Store both original and formatted names, sprite paths, and IDs
+    win.pokemon_data = win.pokemon_dataset.rows()
+    # Sprites of the visible cells {pokemon_original_name: sprite_image}; decoded on demand through POKEMON_SPRITES
+    win.pokemon_grid_sprites = {}
     
     # Store current game generation (default to 9 to show all Pokemon)
     win.current_game_generation = 9
-    
-    if has_icons:
-        for pokemon_name, pokemon_id, icon_url in pokemon_list_raw:
-            # Load icon (small, for tree view)
-            icon_image = load_pokemon_icon(icon_url)
-            if icon_image:
-                win.pokemon_icons.append(icon_image)
-            
-            # Store Pokemon data WITHOUT loading sprite yet (lazy load later)
-            win.pokemon_data.append({
-                'original': pokemon_name,
-                'formatted': format_pokemon_name(pokemon_name),
-                'icon': icon_image,
-                'id': pokemon_id
-            })
-    else:
-        for pokemon_name, pokemon_id in pokemon_list_raw:
-            # Store Pokemon data WITHOUT loading sprite yet (lazy load later)
-            win.pokemon_data.append({
-                'original': pokemon_name,
-                'formatted': format_pokemon_name(pokemon_name),
-                'icon': None,
-                'id': pokemon_id
-            })
 
     
     # Create Pokemon selector (Canvas grid showing 3×1 = 3 items at once)
@@ -2048,64 +3784,6 @@ def rpc_open_options(profile, parent_grab=None):
     win.pokemon_canvas = pokemon_canvas
     win.filtered_pokemon = []  # Stores currently displayed Pokemon
     win.selected_pokemon_name = ""  # Stores selected Pokemon original name
-    win.loaded_sprites = {}  # Cache for loaded sprites {pokemon_original_name: sprite_image}
-    
-    # Helper function to get game generation
-    def get_game_generation(game_name):
-        """Get the Pokemon generation for a given game"""
-        game_lower = game_name.lower()
-        
-        # Generation 1
-        if any(x in game_lower for x in ["red", "blue", "yellow", "green"]):
-            return 1
-        # Generation 2
-        if any(x in game_lower for x in ["gold", "silver", "crystal"]):
-            return 2
-        # Generation 3
-        if any(x in game_lower for x in ["ruby", "sapphire", "emerald", "firered", "leafgreen"]):
-            return 3
-        # Generation 4
-        if any(x in game_lower for x in ["diamond", "pearl", "platinum", "heartgold", "soulsilver"]):
-            return 4
-        # Generation 5
-        if any(x in game_lower for x in ["black", "white"]):
-            return 5
-        # Generation 6
-        if any(x in game_lower for x in ["x ", "y ", " x", " y", "omega ruby", "alpha sapphire"]):
-            return 6
-        # Generation 7
-        if any(x in game_lower for x in ["sun", "moon", "ultra sun", "ultra moon"]):
-            return 7
-        # Generation 8
-        if any(x in game_lower for x in ["sword", "shield", "brilliant diamond", "shining pearl", "legends arceus", "legends: arceus"]):
-            return 8
-        # Generation 9
-        if any(x in game_lower for x in ["scarlet", "violet"]):
-            return 9
-        
-        # Default to showing all Pokemon (Gen 9)
-        return 9
-    
-    def get_pokemon_generation(pokemon_id):
-        """Get generation number from Pokemon ID"""
-        if pokemon_id <= 151:
-            return 1
-        elif pokemon_id <= 251:
-            return 2
-        elif pokemon_id <= 386:
-            return 3
-        elif pokemon_id <= 493:
-            return 4
-        elif pokemon_id <= 649:
-            return 5
-        elif pokemon_id <= 721:
-            return 6
-        elif pokemon_id <= 809:
-            return 7
-        elif pokemon_id <= 905:
-            return 8
-        else:
-            return 9
     
     def draw_grid_cell(canvas, pokemon, x, y, width, height):
         """Draw a single Pokemon grid cell with sprite and name"""
@@ -2117,18 +3795,15 @@ def rpc_open_options(profile, parent_grab=None):
             width=1
         )
         
-        # Load sprite on-demand if not already loaded
-        if 'sprite' not in pokemon or pokemon['sprite'] is None:
-            sprite_image = load_pokemon_sprite(pokemon['original'], pokemon['id'])
-            if sprite_image:
-                pokemon['sprite'] = sprite_image
-                win.pokemon_grid_sprites.append(sprite_image)
+        # Load sprite on-demand; only visible cells hold one
+        sprite_image = POKEMON_SPRITES.photo(pokemon['icon_path'])
         
         # Draw sprite (128×128 centered in cell)
-        if pokemon.get('sprite'):
+        if sprite_image:
+            win.pokemon_grid_sprites[pokemon['original']] = sprite_image
             sprite_x = x + width // 2
             sprite_y = y + 70  # Center 128px sprite vertically in 150px cell
-            canvas.create_image(sprite_x, sprite_y, image=pokemon['sprite'])
+            canvas.create_image(sprite_x, sprite_y, image=sprite_image)
         
         # Draw Pokemon name (bottom of cell)
         name_y = y + height - 10
@@ -2182,10 +3857,11 @@ def rpc_open_options(profile, parent_grab=None):
         )
         
         # Redraw sprite on top of orange background
-        if selected_pokemon.get('sprite'):
+        sprite_image = win.pokemon_grid_sprites.get(selected_pokemon['original'])
+        if sprite_image:
             sprite_x = x + cell_width // 2
             sprite_y = y + 70  # Center 128px sprite vertically in 150px cell
-            canvas.create_image(sprite_x, sprite_y, image=selected_pokemon['sprite'], tags="highlight")
+            canvas.create_image(sprite_x, sprite_y, image=sprite_image, tags="highlight")
         
         # Redraw Pokemon name on top of orange background (in white for contrast)
         name_y = y + cell_height - 10
@@ -2229,20 +3905,13 @@ def rpc_open_options(profile, parent_grab=None):
         
         # Clear canvas
         canvas.delete("all")
+        win.pokemon_grid_sprites.clear()
         
         # Get max generation from current game (stored when game is selected)
         max_generation = getattr(win, 'current_game_generation', 9)  # Default to all Pokemon
         
-        # Filter Pokemon by generation first
-        filtered_by_gen = []
-        for pokemon in win.pokemon_data:
-            # Get Pokemon generation from its ID
-            pokemon_id = pokemon.get('id', 0)
-            pokemon_gen = get_pokemon_generation(pokemon_id)
-            
-            # Only show Pokemon from generations <= max_generation
-            if pokemon_gen <= max_generation:
-                filtered_by_gen.append(pokemon)
+        # Filter Pokemon by generation first (only generations <= max_generation)
+        filtered_by_gen = win.pokemon_data[:win.pokemon_dataset.generation_end(max_generation)]
         
         # Apply search filter with prefix prioritization
         if filter_text:
@@ -2280,6 +3949,9 @@ def rpc_open_options(profile, parent_grab=None):
             
             draw_grid_cell(canvas, pokemon, x, y, cell_width, cell_height)
         
+        # Decode the next few results in the background so typing doesn't wait on disk
+        POKEMON_SPRITES.prefetch(p['icon_path'] for p in win.filtered_pokemon[3:3 + POKEMON_SPRITE_PREFETCH])
+        
         # Select current target if it matches
         if current_target:
             for pokemon in win.filtered_pokemon:
@@ -2361,22 +4033,13 @@ def rpc_open_options(profile, parent_grab=None):
             return
         
         game_id = selection[0]
-        config_path = os.path.join(RPC_CONFIG_FOLDER, f"{game_id}.txt")
         
         # Clear any previous Pokemon selection when changing games
         win.selected_pokemon_name = ""
         
         try:
-            cfg = rpc_read_config(config_path)
-            
-            # Read generation field from config file
-            game_generation = cfg.get("generation", 9)  # Default to 9 (all Pokemon)
-            try:
-                game_generation = int(game_generation)
-                # Clamp to valid range (1-9)
-                win.current_game_generation = max(1, min(9, game_generation))
-            except (ValueError, TypeError):
-                win.current_game_generation = 9  # Default to all if invalid
+            cfg = rpc_get_game_config(game_id)
+            win.current_game_generation = GAME_CATALOG.generation(game_id)
             
             # Repopulate Pokemon grid based on game's generation FIRST
             # This filters Pokemon to only those available in this generation
@@ -2482,12 +4145,11 @@ def rpc_open_options(profile, parent_grab=None):
         profile.mark_dirty()
         
         # Save to game config file as well
-        config_path = os.path.join(RPC_CONFIG_FOLDER, f"{game_id}.txt")
         try:
             # Read existing config to preserve other fields (or get defaults if file doesn't exist)
-            if os.path.exists(config_path):
-                game_cfg = rpc_read_config(config_path)
-            else:
+            try:
+                game_cfg = rpc_get_game_config(game_id)
+            except FileNotFoundError:
                 # File doesn't exist yet, start with defaults
                 game_cfg = {
                     "target": "",
@@ -2505,7 +4167,7 @@ def rpc_open_options(profile, parent_grab=None):
             game_cfg["counter_suffix"] = selected_suffix
             # Note: generation is NOT updated here - it's preserved from the file
             # Write back to file
-            rpc_write_config(config_path, game_cfg)
+            rpc_save_game_config(game_id, game_cfg)
         except Exception as e:
             # If we can't write to game config, show error but don't fail the save
             # Profile config is still saved
@@ -2574,9 +4236,450 @@ def rpc_open_options(profile, parent_grab=None):
     center_window(win, profile.frame.winfo_toplevel())
 
 
-def rpc_shiny_confidence(enc, odds):
-    p = 1 / odds
-    return 1 - (1 - p) ** enc, "▲" if enc >= odds else "▼"
+HUNT_RATE_HALF_LIFE = 600.0   # Seconds for an old encounter's weight in the rate to halve
+HUNT_IDLE_GAP = 300.0         # Longer gaps between encounters are treated as a break
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "--"
+    minutes = int(seconds // 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    return f"{minutes}m {int(seconds % 60):02d}s"
+
+
+class HuntStats:
+    """
+    Running statistics for one hunt, updated in O(1) per counter change.
+
+    The encounter rate is an exponentially weighted average whose weight halves every
+    HUNT_RATE_HALF_LIFE seconds, so it follows the current pace rather than the whole
+    session. Odds-based numbers are derived on read so changing the odds needs no update.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self._rate = None  # Encounters per second
+        self._last_time = None
+
+    def reset(self, count=0):
+        with self._lock:
+            self.count = count
+            self._rate = None
+            self._last_time = None
+
+    def sync(self, count):
+        """Take over a count that changed outside the hunt (file picked, edited externally)."""
+        with self._lock:
+            self.count = count
+
+    def observe(self, amount, count, now=None):
+        """
+        Record that the hunt added amount encounters, leaving the counter at count. The
+        amount is passed in rather than taken from the last known count, which may be
+        stale after the counter file was edited outside the app.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.count = count
+            if amount <= 0:
+                return
+            delta = amount
+            if self._last_time is not None:
+                elapsed = now - self._last_time
+                if 0 < elapsed <= HUNT_IDLE_GAP:
+                    rate = delta / elapsed
+                    if self._rate is None:
+                        self._rate = rate
+                    else:
+                        weight = 1 - 0.5 ** (elapsed / HUNT_RATE_HALF_LIFE)
+                        self._rate += weight * (rate - self._rate)
+            self._last_time = now
+
+    def snapshot(self, odds):
+        """Current statistics as a dict; rate based values are None until there is a pace."""
+        with self._lock:
+            count = self.count
+            rate = self._rate
+
+        odds = max(1, int(odds or 1))
+        # 1 - (1 - 1/odds) ** count without losing precision for large odds
+        probability = -math.expm1(count * math.log1p(-1 / odds)) if odds > 1 else 1.0
+        remaining = max(0, odds - count)
+        return {
+            "count": count,
+            "odds": odds,
+            "probability": probability,
+            "per_hour": rate * 3600 if rate else None,
+            "seconds_per_encounter": 1 / rate if rate else None,
+            "remaining_to_odds": remaining,
+            "seconds_to_odds": remaining / rate if rate else None,
+        }
+
+    def describe(self, odds):
+        stats = self.snapshot(odds)
+        per_hour = f"{stats['per_hour']:.0f}/h" if stats["per_hour"] else "--"
+        per_encounter = (
+            f"{stats['seconds_per_encounter']:.1f} s" if stats["seconds_per_encounter"] else "--"
+        )
+        return (
+            f"Pace: {per_hour} ({per_encounter} each)\n"
+            f"Odds reached: {stats['probability'] * 100:.2f}%\n"
+            f"To 1/{stats['odds']}: {stats['remaining_to_odds']} left, ~{format_duration(stats['seconds_to_odds'])}"
+        )
+
+
+PRESENCE_UPDATE_LIMIT = 5           # Discord accepts about 5 presence updates...
+PRESENCE_UPDATE_WINDOW = 20.0       # ...per 20 seconds
+PRESENCE_KEEPALIVE_SECONDS = 300.0  # Re-send an unchanged presence this often in case Discord dropped it
+PRESENCE_RETRY_SECONDS = PRESENCE_UPDATE_WINDOW / PRESENCE_UPDATE_LIMIT  # Retry a rejected update after this
+
+
+class TokenBucket:
+    """Rate limiter: up to capacity events per period, refilled continuously."""
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self, now=None):
+        """Take a token and return 0, or return how many seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+RPC_RECONNECT_MIN_DELAY = 1.0   # First retry after a failed Discord connect, doubling each time...
+RPC_RECONNECT_MAX_DELAY = 60.0  # ...up to this
+
+
+class DiscordConnection:
+    """
+    One Discord IPC connection for an application ID, kept open across profile starts and stops.
+
+    Only the current owner (a profile index) may publish on it. While it's owned and not
+    connected, a background thread keeps reconnecting with exponential backoff; on_change
+    callbacks are told about every connect and failed attempt.
+    """
+
+    def __init__(self, application_id):
+        self.application_id = application_id
+        self.owner = None
+        self.failures = 0
+        self.generation = 0  # Bumped on every successful connect, so owners re-send their presence
+        self._lock = threading.Lock()
+        self._presence = None
+        self._thread = None
+        self._closed = threading.Event()
+        self._listeners = []
+
+    @property
+    def connected(self):
+        return self._presence is not None
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def _ensure_connecting(self):
+        """Start the reconnect thread if needed. Call with the lock held."""
+        if self._presence is not None or self._closed.is_set():
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._connect_loop, daemon=True)
+        self._thread.start()
+
+    def _connect_loop(self):
+        delay = RPC_RECONNECT_MIN_DELAY
+        while not self._closed.is_set() and self.owner is not None:
+            try:
+                presence = Presence(self.application_id)
+                presence.connect()
+            except Exception:
+                self.failures += 1
+                self._notify()
+                self._closed.wait(delay + random.uniform(0, delay / 2))
+                delay = min(delay * 2, RPC_RECONNECT_MAX_DELAY)
+                continue
+            with self._lock:
+                self._presence = presence
+                self.failures = 0
+                self.generation += 1
+            self._notify()
+            return
+
+    def claim(self, owner, on_change):
+        """Make owner the only profile allowed to publish, taking over from any previous one."""
+        with self._lock:
+            self.owner = owner
+            self._listeners = [on_change]
+            self._ensure_connecting()
+
+    def release(self, owner):
+        """Clear the presence if owner still holds the connection; the IPC pipe stays open."""
+        with self._lock:
+            if self.owner != owner:
+                return
+            self.owner = None
+            self._listeners = []
+            presence = self._presence
+            if presence is not None:
+                try:
+                    presence.clear()
+                except Exception:
+                    self._drop()
+
+    def update(self, owner, payload):
+        """Publish payload; returns False if owner no longer holds the connection or it's down."""
+        with self._lock:
+            if self.owner != owner or self._presence is None:
+                return False
+            try:
+                self._presence.update(**payload)
+                return True
+            except Exception as exc:
+                if DiscordServerError is not None and isinstance(exc, DiscordServerError):
+                    return False  # Discord answered (e.g. rate limited); the pipe itself is fine
+                self._drop()
+                self._ensure_connecting()
+                return False
+
+    def _drop(self):
+        """Forget a broken connection. Call with the lock held."""
+        presence, self._presence = self._presence, None
+        try:
+            presence.close()
+        except Exception:
+            pass
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            self.owner = None
+            if self._presence is not None:
+                try:
+                    self._presence.clear()
+                except Exception:
+                    pass
+                self._drop()
+
+
+class DiscordConnectionManager:
+    """Process-wide DiscordConnection per application ID."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def acquire(self, application_id, owner, on_change):
+        with self._lock:
+            connection = self._connections.get(application_id)
+            if connection is None:
+                connection = DiscordConnection(application_id)
+                self._connections[application_id] = connection
+        connection.claim(owner, on_change)
+        return connection
+
+    def close_all(self):
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+
+DISCORD_CONNECTIONS = DiscordConnectionManager()
+atexit.register(DISCORD_CONNECTIONS.close_all)
+
+
+PRESENCE_MODE_ROTATE = "rotate"    # Show each running hunt in turn
+PRESENCE_MODE_SUMMARY = "summary"  # One activity summing up every running hunt
+PRESENCE_ROTATE_SECONDS = 30.0     # How long each hunt is shown in rotate mode
+
+
+def format_hunt_presence(hunt):
+    """Activity for a single hunt, as returned by a PresenceCompositor source."""
+    status = "▲" if hunt["encounters"] >= hunt["odds"] else "▼"
+    # Format Pokemon name for display (capitalize properly)
+    formatted_target = hunt["target"].replace("-", " ").title() if hunt["target"] else ""
+    return {
+        "details": f"✦ {formatted_target} • {hunt['encounters']} {hunt['suffix'] or 'Encounters'}",
+        "state": f"{status} Confidence: {hunt['probability'] * 100:.2f}% ",
+        "large_image": hunt["icon"],
+        "large_text": hunt["game"],
+    }
+
+
+def format_summary_presence(hunts):
+    """One activity for several hunts; the game art comes from the first one started."""
+    if len(hunts) == 1:
+        return format_hunt_presence(hunts[0])
+    total = sum(hunt["encounters"] for hunt in hunts)
+    best = max(hunts, key=lambda hunt: hunt["probability"])
+    status = "▲" if best["encounters"] >= best["odds"] else "▼"
+    return {
+        "details": f"✦ {len(hunts)} hunts • {total:,} total",
+        "state": f"{status} Best confidence: {best['probability'] * 100:.2f}% ",
+        "large_image": hunts[0]["icon"],
+        "large_text": hunts[0]["game"],
+    }
+
+
+class PresenceCompositor:
+    """
+    Turns every broadcasting profile into one Discord activity.
+
+    Profiles register a source: a callable returning their hunt state (see
+    format_hunt_presence). A single thread, one TokenBucket and one Discord connection serve
+    them all; the activity either rotates between hunts every PRESENCE_ROTATE_SECONDS or
+    sums them up, depending on the presence mode. Sends happen when wake() is called (counter
+    changes, settings edits), when the rotation moves on, or as a keepalive.
+    """
+
+    OWNER = "presence"
+
+    def __init__(self, connections):
+        self.connections = connections
+        self.mode = PRESENCE_MODE_ROTATE
+        self._lock = threading.Lock()
+        self._sources = {}  # owner -> (application_id, get_hunt, on_connect_failure), in start order
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def add(self, owner, application_id, get_hunt, on_connect_failure=None):
+        with self._lock:
+            self._sources.pop(owner, None)
+            self._sources[owner] = (application_id, get_hunt, on_connect_failure)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self.wake()
+
+    def remove(self, owner):
+        with self._lock:
+            self._sources.pop(owner, None)
+        self.wake()
+
+    def set_mode(self, mode):
+        self.mode = mode if mode in (PRESENCE_MODE_ROTATE, PRESENCE_MODE_SUMMARY) else PRESENCE_MODE_ROTATE
+        self.wake()
+
+    def wake(self):
+        self._wake.set()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._sources.clear()
+        self.wake()
+
+    def _run(self):
+        bucket = TokenBucket(PRESENCE_UPDATE_LIMIT, PRESENCE_UPDATE_WINDOW)
+        connection = None
+        generation = None
+        reported = False
+        last_payload = None
+        last_sent = 0.0
+        rotation = -1  # Advanced before first use, so the first profile started is shown first
+        next_rotation = 0.0
+
+        while True:
+            self._wake.clear()
+            with self._lock:
+                closed = self._closed
+                sources = list(self._sources.values())
+
+            if not sources:
+                if connection is not None:
+                    # Clears the activity; the connection stays open for the next start
+                    connection.release(self.OWNER)
+                    connection = None
+                    last_payload = None
+                if closed:
+                    return
+                self._wake.wait()
+                continue
+
+            now = time.monotonic()
+            hunts = []
+            for _, get_hunt, _ in sources:
+                try:
+                    hunts.append(get_hunt())
+                except Exception:
+                    hunts.append(None)
+            live = [(source, hunt) for source, hunt in zip(sources, hunts) if hunt is not None]
+            if not live:
+                self._wake.wait(PRESENCE_KEEPALIVE_SECONDS)
+                continue
+
+            if self.mode == PRESENCE_MODE_SUMMARY:
+                lead = live[0][0]
+                payload = format_summary_presence([hunt for _, hunt in live])
+            else:
+                if now >= next_rotation:
+                    rotation += 1
+                    next_rotation = now + PRESENCE_ROTATE_SECONDS
+                lead, hunt = live[rotation % len(live)]
+                payload = format_hunt_presence(hunt)
+            application_id, _, on_connect_failure = lead
+
+            if connection is None or connection.application_id != application_id:
+                # Each game has its own Discord application, so rotating between games switches connection
+                if connection is not None:
+                    connection.release(self.OWNER)
+                connection = self.connections.acquire(application_id, self.OWNER, self.wake)
+                generation = None
+                reported = False
+
+            if not connection.connected:
+                if connection.failures and not reported:
+                    reported = True
+                    if on_connect_failure is not None:
+                        on_connect_failure()
+                self._wake.wait(PRESENCE_KEEPALIVE_SECONDS)
+                continue
+            if connection.generation != generation:
+                # Fresh connection: Discord has nothing shown for us yet
+                generation = connection.generation
+                last_payload = None
+                reported = False
+
+            if payload != last_payload or now - last_sent >= PRESENCE_KEEPALIVE_SECONDS:
+                wait = bucket.reserve(now)
+                if wait > 0:
+                    # Anything that changes meanwhile is folded into the next send
+                    self._wake.wait(wait)
+                    continue
+                if not connection.update(self.OWNER, payload):
+                    # Rejected (e.g. rate limited) or the pipe dropped: try the same payload again soon
+                    self._wake.wait(PRESENCE_RETRY_SECONDS)
+                    continue
+                last_payload = payload
+                last_sent = now
+
+            timeout = max(0.0, PRESENCE_KEEPALIVE_SECONDS - (time.monotonic() - last_sent))
+            if self.mode == PRESENCE_MODE_ROTATE and len(live) > 1:
+                timeout = min(timeout, max(0.0, next_rotation - time.monotonic()))
+            self._wake.wait(timeout)
+
+
+PRESENCE = PresenceCompositor(DISCORD_CONNECTIONS)
+atexit.register(PRESENCE.close)
+
 
 
 # =========================
@@ -2744,12 +4847,20 @@ class ProfileTab:
         self.notebook = parent
         self.profile_index = profile_index
         self.default_tab_name = f"Profile {profile_index}"
-        self.config_path = os.path.join("config", f"config{profile_index}.txt")
+        self.config = SETTINGS.profile(profile_index)
+        self._config_flush_after_id = None
 
         self.selected_image_path = ""
         self.selected_text_path = ""
         self.last_match_time = 0.0
         self.is_running = False
+        self.match_method = MATCH_METHOD_TEMPLATE
+        self.feature_matcher = None
+        self._validation_cache = None  # (auto mode, increment) from the last passing validation
+        self.detection_settings = None  # DetectionSettings used by the auto loop, see refresh_detection_settings
+        self.capture_client_only = False
+        self.capture_crop = None  # (x, y, w, h) in window coordinates, None captures everything
+        self.capture_scale = 1.0
         self.configure_window = None
         self.test_window = None
         self.test_image_button = None
@@ -2772,15 +4883,12 @@ class ProfileTab:
         self._alert_icon_selected = None
         self._alert_icon_unselected = None
 
-        self.rpc = None
-        self.rpc_thread = None
-        self.rpc_stop_event = threading.Event()
+        self.rpc_counter_store = None
         self.rpc_game_id = ""
         self.rpc_target = ""
         self.rpc_odds = 8192
         self.rpc_is_running = False
         self.rpc_enabled = False
-        self.rpc_last_stop_time = 0.0
         self.rpc_counter_suffix = "Encounters"
 
         self.auto_count_var = tk.BooleanVar(value=False)
@@ -2827,6 +4935,10 @@ class ProfileTab:
         self.increment_var.trace_add("write", self._on_increment_change)
 
         self.frame = tk.Frame(parent, bg=DARK_BG, highlightthickness=0, bd=0)
+        self.detection_watchdog = DetectionWatchdog(self.frame)
+        self.last_capture_hwnd = None
+        self.buffer_pool = FrameBufferPool()  # Only used from the detection watchdog's thread
+        self.hunt_stats = HuntStats()
 
         self.build_ui()
         self.schedule_autosave()
@@ -3297,6 +5409,27 @@ class ProfileTab:
         tooltip_check.pack(pady=STANDARD_BUTTON_PADY)
         add_tooltip(tooltip_check, "If I'm getting annoying, click here and I'll stop giving you extra information when you hover things!")
 
+        summary_var = tk.BooleanVar(value=PRESENCE.mode == PRESENCE_MODE_SUMMARY)
+
+        def on_toggle_presence_summary():
+            mode = PRESENCE_MODE_SUMMARY if summary_var.get() else PRESENCE_MODE_ROTATE
+            PRESENCE.set_mode(mode)
+            save_presence_mode(mode)
+
+        summary_check = tk.Checkbutton(
+            self._settings_frame,
+            text="Combine Hunts in Discord Status",
+            variable=summary_var,
+            command=on_toggle_presence_summary,
+            bg=DARK_BG,
+            fg=DARK_FG,
+            activebackground=DARK_BG,
+            activeforeground=DARK_FG,
+            selectcolor=DARK_BG
+        )
+        summary_check.pack(pady=STANDARD_BUTTON_PADY)
+        add_tooltip(summary_check, "When more than one profile is broadcasting, I'll show one status with all your hunts added up instead of taking turns between them!")
+
         def close_settings():
             self.close_settings_view()
 
@@ -4047,41 +6180,30 @@ class ProfileTab:
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_MANUAL, "1" if self.alert_play_manual else "0")
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_HOTKEY, "1" if self.alert_play_hotkey else "0")
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_AUTO, "1" if self.alert_play_auto else "0")
+        self.update_config_value(CONFIG_KEY_COUNT_INSTANCES, "1" if self.count_instances_var.get() else "0")
+        self.update_config_value(CONFIG_KEY_MATCH_METHOD, self.match_method)
+        self.update_config_value(CONFIG_KEY_CAPTURE_CLIENT_ONLY, "1" if self.capture_client_only else "0")
+        self.update_config_value(CONFIG_KEY_CAPTURE_CROP, format_capture_crop(self.capture_crop))
+        self.update_config_value(CONFIG_KEY_CAPTURE_SCALE, str(self.capture_scale))
+        self._flush_config()
 
         self.set_tab_title()
 
     # ---------- Config helpers ----------
     def load_config_value(self, key, default_value):
-        if not os.path.exists(self.config_path):
-            return default_value
-
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.lower().startswith(key):
-                    return line.split(":", 1)[1].strip()
-
-        return default_value
+        return self.config.get(key, default_value)
 
     def update_config_value(self, key, value):
-        lines = []
-        found = False
-
-        if os.path.exists(self.config_path):
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-        for i, line in enumerate(lines):
-            if line.lower().startswith(key):
-                lines[i] = f"{key} {value}\n"
-                found = True
-                break
+        # Changes made in the same Tk event are written together once the UI is idle
+        self.config.set(key, value)
+        if self.config.dirty and self._config_flush_after_id is None:
+            self._config_flush_after_id = self.frame.after_idle(self._flush_config)
 
-        if not found:
-            lines.append(f"{key} {value}\n")
-
-        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+    def _flush_config(self):
+        if self._config_flush_after_id is not None:
+            self.frame.after_cancel(self._config_flush_after_id)
+            self._config_flush_after_id = None
+        self.config.flush()
 
     def _get_increment_amount(self):
         try:
@@ -4127,6 +6249,7 @@ class ProfileTab:
         self._update_manual_buttons()
 
     def _on_increment_change(self, *_):
+        self.invalidate_validation()
         if self._loading_config:
             return
         self.mark_dirty()
@@ -4135,7 +6258,30 @@ class ProfileTab:
 
     def _on_image_path_change(self, *_):
         self.selected_image_path = self.image_path_var.get().strip()
+        self.invalidate_validation()
+        self.refresh_detection_settings()
         self.mark_dirty()
+        self.watch_files()
+
+    def watch_files(self):
+        """Re-validate when the counter file or reference changes (or disappears) on disk."""
+        if FILE_WATCHER is None:
+            return
+        FILE_WATCHER.watch(("counter", self.profile_index), self.selected_text_path, self._on_counter_file_changed)
+        FILE_WATCHER.watch(("reference", self.profile_index), self.selected_image_path, self._on_reference_file_changed)
+
+    def _on_counter_file_changed(self, path):
+        self.invalidate_validation()
+        # Edited outside the app: the presence thread re-reads it through the counter store
+        PRESENCE.wake()
+
+    def _on_reference_file_changed(self, path):
+        self.invalidate_validation()
+        # The caches already key on mtime; this just frees the stale copies right away
+        invalidate_template(self.selected_image_path)
+        invalidate_template(path)
+        if self.feature_matcher is not None:
+            self.feature_matcher.invalidate()
 
     def _is_text_path_in_use(self, new_path):
         if not new_path:
@@ -4182,16 +6328,20 @@ class ProfileTab:
 
         self.selected_text_path = new_path
         self._last_text_path = new_path
+        self.invalidate_validation()
         self.mark_dirty()
+        self.watch_files()
         if new_path and os.path.isfile(new_path):
             try:
-                current_value = read_number_from_file(new_path)
+                current_value = get_counter_store(new_path).get()
+                self.hunt_stats.reset(current_value)
                 self.lbl_current_count.config(text=str(current_value))
             except Exception:
                 self.lbl_current_count.config(text="(invalid)")
 
     def _on_title_change(self, *_):
         self.mark_dirty()
+        self.refresh_detection_settings()
 
     def _on_profile_name_change(self, *_):
         """Handle profile name changes on keystroke - only enforce max length."""
@@ -4351,6 +6501,12 @@ class ProfileTab:
         self.cooldown_var.set(5)
         self.frequency_var.set(0.5)
         self.threshold_var.set(0.9)
+        self.count_instances_var.set(False)
+        self.match_method = MATCH_METHOD_TEMPLATE
+        self.capture_client_only = False
+        self.capture_crop = None
+        self.capture_scale = 1.0
+        self.refresh_detection_settings()
 
         self.count_plus_hotkey = ""
         self.count_minus_hotkey = ""
@@ -4396,6 +6552,11 @@ class ProfileTab:
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_MANUAL, "1")
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_HOTKEY, "1")
         self.update_config_value(CONFIG_KEY_ALERT_PLAY_AUTO, "1")
+        self.update_config_value(CONFIG_KEY_COUNT_INSTANCES, "0")
+        self.update_config_value(CONFIG_KEY_MATCH_METHOD, MATCH_METHOD_TEMPLATE)
+        self.update_config_value(CONFIG_KEY_CAPTURE_CLIENT_ONLY, "0")
+        self.update_config_value(CONFIG_KEY_CAPTURE_CROP, "")
+        self.update_config_value(CONFIG_KEY_CAPTURE_SCALE, "1.0")
 
         self.save_settings_silent()
         self._update_manual_buttons()
@@ -4643,6 +6804,7 @@ class ProfileTab:
             pady=2
         )
         self.lbl_current_count.pack(side="left", padx=0)
+        add_tooltip(self.lbl_current_count, lambda: self.hunt_stats.describe(self.rpc_odds))
         self.btn_increment = tk.Button(
             row_counter_increment,
             text="+1",
@@ -4814,10 +6976,14 @@ class ProfileTab:
         self.cooldown_var = tk.IntVar(value=5)
         self.frequency_var = tk.DoubleVar(value=0.5)
         self.threshold_var = tk.DoubleVar(value=0.9)
+        self.count_instances_var = tk.BooleanVar(value=False)
 
         self.cooldown_var.trace_add("write", lambda *_: self.mark_dirty())
         self.frequency_var.trace_add("write", lambda *_: self.mark_dirty())
         self.threshold_var.trace_add("write", lambda *_: self.mark_dirty())
+        self.count_instances_var.trace_add("write", lambda *_: self.mark_dirty())
+        for var in (self.cooldown_var, self.frequency_var, self.threshold_var, self.count_instances_var):
+            var.trace_add("write", self.refresh_detection_settings)
 
     # ---------- State helpers ----------
     def set_settings_state(self, enabled):
@@ -4872,77 +7038,80 @@ class ProfileTab:
                 self.notebook.tab(self.frame, text=name, image="")
 
     def validate_required_inputs(self, show_popup=True):
+        is_valid, increment_amount, error = self._check_required_inputs()
+        if error is not None:
+            self._validation_cache = None
+            if show_popup:
+                show_custom_error("count_error", *error)
+        else:
+            self._validation_cache = (bool(self.auto_count_var.get()), increment_amount)
+        return is_valid, increment_amount
+
+    def invalidate_validation(self, *_):
+        self._validation_cache = None
+
+    def _cached_validation(self):
+        """
+        validate_required_inputs() for the auto loop. The file checks only run again after a
+        path, the increment or one of the files themselves changed (see watch_files).
+        """
+        cached = self._validation_cache
+        if cached is not None and cached[0] == bool(self.auto_count_var.get()):
+            return True, cached[1]
+        return self.validate_required_inputs(show_popup=True)
+
+    def _check_required_inputs(self):
+        """Return (is_valid, increment_amount, (error title, message) or None)."""
         increment_text = self.entry_increment.get().strip()
 
         if not self.selected_text_path:
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 30604057: Missing File",
-                    "No text file selected. Rotom needs a document to count in."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 30604057: Missing File",
+                "No text file selected. Rotom needs a document to count in."
+            )
 
         if not os.path.isfile(self.selected_text_path):
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 70020494: Missing File",
-                    "The selected text file no longer exists."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 70020494: Missing File",
+                "The selected text file no longer exists."
+            )
 
         if not is_counter_file_numeric(self.selected_text_path):
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 90518840: Invalid File Contents",
-                    "The selected text file contains non-numeric text. Please select a new file."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 90518840: Invalid File Contents",
+                "The selected text file contains non-numeric text. Please select a new file."
+            )
 
         if not self.auto_count_var.get():
-            return True, None
+            return True, None, None
 
         if not self.selected_image_path:
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 68915449: Missing File",
-                    "No image file selected. Auto mode requires Rotom to have a reference frame."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 68915449: Missing File",
+                "No image file selected. Auto mode requires Rotom to have a reference frame."
+            )
 
         if not os.path.isfile(self.selected_image_path):
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 07281901: Missing File",
-                    "The selected image file no longer exists."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 07281901: Missing File",
+                "The selected image file no longer exists."
+            )
 
         try:
             increment_amount = int(increment_text)
         except ValueError:
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 12282823: Invalid Increment",
-                    "Increment amount must be a number between 1 and 99."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 12282823: Invalid Increment",
+                "Increment amount must be a number between 1 and 99."
+            )
 
         if not (MIN_INCREMENT <= increment_amount <= MAX_INCREMENT):
-            if show_popup:
-                show_custom_error(
-                    "count_error",
-                    "Error ID 27444533: Invalid Increment",
-                    "Increment amount must be a number between 1 and 99."
-                )
-            return False, None
+            return False, None, (
+                "Error ID 27444533: Invalid Increment",
+                "Increment amount must be a number between 1 and 99."
+            )
 
-        return True, increment_amount
+        return True, increment_amount, None
 
     # ---------- UI actions ----------
     def on_profile_name_change(self, event=None):
@@ -4996,7 +7165,9 @@ class ProfileTab:
             return
 
         try:
-            screenshot_img = grab_window_image(hwnd)
+            # Always show the whole window here so a capture area can be picked from it
+            screenshot_img = grab_window_image(hwnd, client_only=self.capture_client_only)
+            client_offset = get_client_offset(hwnd) if self.capture_client_only else (0, 0)
         except Exception as exc:
             show_custom_error(
                 "count_error",
@@ -5055,14 +7226,15 @@ class ProfileTab:
         canvas.bind("<B1-Motion>", on_drag)
         canvas.bind("<ButtonRelease-1>", on_release)
 
-        def save_crop():
+        def get_selection():
+            """Return the selection in screenshot pixels, or None after showing an error."""
             if not crop_state["box"]:
                 show_custom_error(
                     "count_error",
                     "Error ID 38319817: Invalid Crop",
                     "No crop has been selected. Please use the cursor to select an area of the image which you would like to crop and save."
                 )
-                return
+                return None
 
             x0, y0, x1, y1 = crop_state["box"]
             left = min(x0, x1)
@@ -5076,7 +7248,7 @@ class ProfileTab:
                     "Error ID 32712951: Invalid Crop",
                     "Designated crop area is too small. Please try again."
                 )
-                return
+                return None
 
             scale_x = orig_w / display_w
             scale_y = orig_h / display_h
@@ -5092,8 +7264,16 @@ class ProfileTab:
                     "Error ID 04172198: Invalid Crop",
                     "Designated crop area is invalid. Please try again."
                 )
+                return None
+
+            return crop_left, crop_top, crop_right, crop_bottom
+
+        def save_crop():
+            selection = get_selection()
+            if selection is None:
                 return
 
+            crop_left, crop_top, crop_right, crop_bottom = selection
             cropped = screenshot_img.crop((crop_left, crop_top, crop_right, crop_bottom))
             filename = f"profile_{self.profile_index}.png"
             path = os.path.join(REFERENCES_FOLDER, filename)
@@ -5119,11 +7299,34 @@ class ProfileTab:
             self._exit_modal()
             self.frame.winfo_toplevel().focus_force()
 
+        def set_capture_area():
+            selection = get_selection()
+            if selection is None:
+                return
+
+            crop_left, crop_top, crop_right, crop_bottom = selection
+            # Stored in window coordinates so it stays valid when "Ignore window borders" is toggled
+            self.capture_crop = (
+                crop_left + client_offset[0],
+                crop_top + client_offset[1],
+                crop_right - crop_left,
+                crop_bottom - crop_top
+            )
+            self.refresh_detection_settings()
+            self.mark_dirty()
+            close_capture()
+
+        def clear_capture_area():
+            self.capture_crop = None
+            self.refresh_detection_settings()
+            self.mark_dirty()
+            close_capture()
+
         buttons = tk.Frame(crop_win, bg=DARK_BG)
         buttons.pack(padx=10, pady=(0, 10), fill="x")
 
         buttons.grid_columnconfigure(0, weight=1)
-        buttons.grid_columnconfigure(1, weight=1)
+        buttons.grid_columnconfigure(3, weight=1)
 
         tk.Button(
             buttons,
@@ -5133,6 +7336,25 @@ class ProfileTab:
             pady=BUTTON_PADY,
             height=BUTTON_HEIGHT
         ).grid(row=0, column=0, padx=(0, 8), sticky="e")
+        area_button = tk.Button(
+            buttons,
+            text="Set Capture Area",
+            command=set_capture_area,
+            padx=BUTTON_PADX,
+            pady=BUTTON_PADY,
+            height=BUTTON_HEIGHT
+        )
+        area_button.grid(row=0, column=1, padx=8)
+        add_tooltip(area_button, "I'll only look inside the selected area while counting, which is faster than scanning the whole window.")
+        if self.capture_crop:
+            tk.Button(
+                buttons,
+                text="Clear Capture Area",
+                command=clear_capture_area,
+                padx=BUTTON_PADX,
+                pady=BUTTON_PADY,
+                height=BUTTON_HEIGHT
+            ).grid(row=0, column=2, padx=8)
         tk.Button(
             buttons,
             text="Cancel",
@@ -5140,7 +7362,7 @@ class ProfileTab:
             padx=BUTTON_PADX,
             pady=BUTTON_PADY,
             height=BUTTON_HEIGHT
-        ).grid(row=0, column=1, padx=(8, 0), sticky="w")
+        ).grid(row=0, column=3, padx=(8, 0), sticky="w")
         crop_win.protocol("WM_DELETE_WINDOW", close_capture)
 
         center_window(crop_win, self.frame.winfo_toplevel())
@@ -5183,7 +7405,7 @@ class ProfileTab:
         
         self.test_window = tk.Toplevel(self.frame)
         apply_window_style(self.test_window)
-        self.test_window.geometry("280x300")  # Reduced height by 20px
+        self.test_window.geometry("280x350")  # Room for the feature/template and full-size comparison lines
         self.test_window.resizable(False, False)
         self._position_popup_near_root(self.test_window)
 
@@ -5224,6 +7446,10 @@ class ProfileTab:
         status_label.pack(pady=5)
 
         is_active = {"running": True}
+        # Separate from the auto watchdog so testing doesn't count towards its stalls
+        test_watchdog = DetectionWatchdog(self.test_window)
+        # Own matcher too: the auto loop may be using self.feature_matcher on its thread
+        test_matchers = {}
 
         def on_close():
             is_active["running"] = False
@@ -5254,24 +7480,68 @@ class ProfileTab:
                     image_label.config(image=not_visible_photo)
                 status_label.config(text="Not detected\nWindow is minimized")
             else:
-                try:
-                    screenshot_img = grab_window_image(hwnd)
+                settings = self.build_detection_settings()
+                threshold = settings.threshold
+                count_instances = settings.count_instances
+
+                def measure():
+                    # Runs on the watchdog's thread: no Tk calls in here
+                    screenshot_img = self._grab_frame(hwnd, settings)
+
+                    start = time.perf_counter()
                     is_match, confidence = compare_images(
-                        screenshot_img, self.selected_image_path, threshold=float(self.threshold_var.get())
+                        screenshot_img,
+                        settings.image_path,
+                        threshold=threshold,
+                        count_instances=count_instances,
+                        scale=settings.capture_scale
                     )
+                    template_ms = (time.perf_counter() - start) * 1000
                     percent = max(0.0, min(1.0, confidence)) * 100
-                    
+                    detail_text = f"Match: {percent:.1f}% • {template_ms:.0f} ms"
+                    counted = count_instances
+
+                    if settings.capture_scale != 1.0:
+                        # Run a full-resolution pass alongside so a capture scale can be judged before relying on it
+                        start = time.perf_counter()
+                        full_img = grab_window_image(hwnd, client_only=settings.capture_client_only, crop=settings.capture_crop)
+                        _, full_confidence = compare_images(full_img, settings.image_path, threshold=threshold)
+                        full_ms = (time.perf_counter() - start) * 1000
+                        full_percent = max(0.0, min(1.0, full_confidence)) * 100
+                        detail_text += f"\nFull size: {full_percent:.1f}% • {full_ms:.0f} ms"
+
+                    if settings.match_method == MATCH_METHOD_FEATURES:
+                        # Show the feature matcher next to template matching so both can be compared
+                        if "features" not in test_matchers:
+                            test_matchers["features"] = FeatureMatcher()
+                        start = time.perf_counter()
+                        is_match, _, inliers = test_matchers["features"].compare(screenshot_img, settings.image_path)
+                        features_ms = (time.perf_counter() - start) * 1000
+                        detail_text = f"Features: {inliers} inliers • {features_ms:.0f} ms\n" + detail_text.replace("Match:", "Template:", 1)
+                        counted = False
+
+                    return is_match, counted, detail_text
+
+                def show_result(result):
+                    if not is_active["running"]:
+                        return
+                    is_match, counted, detail_text = result
                     if is_match:
                         # Show visible image
                         if visible_photo:
                             image_label.config(image=visible_photo)
-                        status_label.config(text=f"Image detected\nMatch: {percent:.1f}%")
+                        detected_text = f"Image detected x{is_match}" if counted else "Image detected"
+                        status_label.config(text=f"{detected_text}\n{detail_text}")
                     else:
                         # Show not visible image
                         if not_visible_photo:
                             image_label.config(image=not_visible_photo)
-                        status_label.config(text=f"Not detected\nMatch: {percent:.1f}%")
-                except Exception as exc:
+                        status_label.config(text=f"Not detected\n{detail_text}")
+                    self.test_window.after(200, update_result)
+
+                def show_error(exc):
+                    if not is_active["running"]:
+                        return
                     # If template image can't be loaded (e.g., profile reset), close window
                     if "Failed to load template image" in str(exc):
                         on_close()
@@ -5280,6 +7550,20 @@ class ProfileTab:
                     if not_visible_photo:
                         image_label.config(image=not_visible_photo)
                     status_label.config(text=f"Error\n{exc}")
+                    self.test_window.after(200, update_result)
+
+                def show_stall():
+                    if not is_active["running"]:
+                        return
+                    if not_visible_photo:
+                        image_label.config(image=not_visible_photo)
+                    status_label.config(text=f"Not responding\nCapture took over {test_watchdog.deadline:.0f} s")
+                    self.test_window.after(200, update_result)
+
+                if not test_watchdog.submit(measure, show_result, on_error=show_error, on_stall=show_stall):
+                    # The last capture is still stuck in the window; check back later
+                    self.test_window.after(200, update_result)
+                return
 
             self.test_window.after(200, update_result)
 
@@ -5298,7 +7582,7 @@ class ProfileTab:
 
     def on_save_settings(self):
         self.save_settings_silent()
-        messagebox.showinfo("Saved", f"Settings saved to {os.path.basename(self.config_path)}")
+        messagebox.showinfo("Saved", f"Settings saved to {os.path.basename(SETTINGS.path)}")
 
     def on_toggle_rpc_enabled(self):
         self.rpc_enabled = self.rpc_enabled_var.get()
@@ -5345,20 +7629,6 @@ class ProfileTab:
                     return
 
             if self.rpc_enabled:
-                if time.monotonic() - self.rpc_last_stop_time < 30:
-                    show_custom_error(
-                        "rpc_error",
-                        "Error ID 67554378: Active Session",
-                        "The RPC session is still active. If you have recently closed the session please wait 30 seconds and try again."
-                    )
-                    return
-                if ACTIVE_BROADCAST_PROFILE is not None and ACTIVE_BROADCAST_PROFILE != self.profile_index:
-                    show_custom_error(
-                        "count_error",
-                        "Error ID 77970901: Active Broadcast",
-                        "Another channel is broadcasting. If you see this error please contact au.xiii on Discord for support."
-                    )
-                    return
                 if not self.rpc_game_id:
                     show_custom_error(
                         "rpc_error",
@@ -5378,6 +7648,8 @@ class ProfileTab:
             self._set_counter_button_colors(True)
             self.set_tab_title()
             if self.auto_count_var.get():
+                self.refresh_detection_settings()
+                self.detection_watchdog.reset_backoff()
                 self.auto_check_loop()
         else:
             # Play stop sound
@@ -5412,7 +7684,9 @@ class ProfileTab:
             amount = delta * self._get_increment_amount()
 
         try:
-            new_value = increment_number_in_file(self.selected_text_path, amount)
+            new_value = get_counter_store(self.selected_text_path).add(amount)
+            self._record_encounter(source, amount, new_value)
+            self.hunt_stats.observe(amount, new_value)
             self.lbl_current_count.config(text=str(new_value))
             if amount > 0 and self._should_play_alert_for(source):
                 self._maybe_play_alert()
@@ -5437,8 +7711,11 @@ class ProfileTab:
         if not messagebox.askyesno("Reset Counter", "Reset the count to 0?"):
             return
         try:
-            with open(self.selected_text_path, "w", encoding="utf-8") as f:
-                f.write("0")
+            store = get_counter_store(self.selected_text_path)
+            # Keep the finished phase in the history instead of losing it with the count
+            ENCOUNTER_HISTORY.archive_phase(self.profile_index, store.get())
+            store.set(0)
+            self.hunt_stats.reset(0)
             self.lbl_current_count.config(text="0")
         except Exception:
             self.lbl_current_count.config(text="(invalid)")
@@ -5583,19 +7860,16 @@ class ProfileTab:
         for game_id in rpc_find_game_configs():
             display_name = game_id
             icon_image = None
-            config_path = os.path.join(RPC_CONFIG_FOLDER, f"{game_id}.txt")
             
             try:
-                cfg = rpc_read_config(config_path)
+                cfg = rpc_get_game_config(game_id)
                 if cfg.get("game"):
                     display_name = cfg["game"]
                 
                 icon_name = cfg.get("icon", "")
                 if icon_name:
-                    icon_path = os.path.join(SCRIPT_FOLDER, "assets", "game_icon", f"{icon_name}.png")
-                    if os.path.isfile(icon_path):
-                        image = Image.open(icon_path).resize((RPC_ICON_SIZE, RPC_ICON_SIZE), Image.LANCZOS)
-                        icon_image = ImageTk.PhotoImage(image)
+                    icon_image = GAME_ICONS.photo(os.path.join(SCRIPT_FOLDER, "assets", "game_icon", f"{icon_name}.png"))
+                    if icon_image:
                         rpc_icons.append(icon_image)
             except Exception:
                 pass
@@ -5659,109 +7933,14 @@ class ProfileTab:
         pokemon_canvas.pack(side="left", fill="both", expand=True)
         
         # Storage for Pokemon data
-        pokemon_data = []
-        pokemon_icons = []
-        pokemon_grid_sprites = []
+        pokemon_grid_sprites = {}  # Sprites of the visible cells {pokemon_original_name: sprite_image}
         filtered_pokemon = []
         selected_pokemon_name = ""
-        loaded_sprites = {}
         current_game_generation = 9
         
-        # Helper functions
-        def format_pokemon_name(name):
-            """Format Pokemon name: replace hyphens with spaces and title case"""
-            return name.replace("-", " ").title()
-        
-        def load_pokemon_sprite(pokemon_name, pokemon_id):
-            """Load Pokemon sprite from assets/pokemon_icons/ at original 128x128 size"""
-            if not pokemon_name or not pokemon_id:
-                return None
-            
-            try:
-                sprite_filename = f"{pokemon_id}_{pokemon_name}.png"
-                sprite_path = resource_path(os.path.join("assets", "pokemon_icons", sprite_filename))
-                
-                if os.path.exists(sprite_path):
-                    image = Image.open(sprite_path)
-                    return ImageTk.PhotoImage(image)
-                return None
-            except Exception:
-                return None
-        
-        def get_game_generation(game_name):
-            """Get the Pokemon generation for a given game"""
-            game_lower = game_name.lower()
-            
-            if any(x in game_lower for x in ["red", "blue", "yellow", "green"]):
-                return 1
-            if any(x in game_lower for x in ["gold", "silver", "crystal"]):
-                return 2
-            if any(x in game_lower for x in ["ruby", "sapphire", "emerald", "firered", "leafgreen"]):
-                return 3
-            if any(x in game_lower for x in ["diamond", "pearl", "platinum", "heartgold", "soulsilver"]):
-                return 4
-            if any(x in game_lower for x in ["black", "white"]):
-                return 5
-            if any(x in game_lower for x in ["x ", "y ", " x", " y", "omega ruby", "alpha sapphire"]):
-                return 6
-            if any(x in game_lower for x in ["sun", "moon", "ultra sun", "ultra moon"]):
-                return 7
-            if any(x in game_lower for x in ["sword", "shield", "brilliant diamond", "shining pearl", "legends arceus", "legends: arceus"]):
-                return 8
-            if any(x in game_lower for x in ["scarlet", "violet"]):
-                return 9
-            
-            return 9  # Default to all Pokemon
-        
-        def get_pokemon_generation(pokemon_id):
-            """Get generation number from Pokemon ID"""
-            if pokemon_id <= 151:
-                return 1
-            elif pokemon_id <= 251:
-                return 2
-            elif pokemon_id <= 386:
-                return 3
-            elif pokemon_id <= 493:
-                return 4
-            elif pokemon_id <= 649:
-                return 5
-            elif pokemon_id <= 721:
-                return 6
-            elif pokemon_id <= 809:
-                return 7
-            elif pokemon_id <= 905:
-                return 8
-            else:
-                return 9
-        
-        # Load Pokemon list
-        pokemon_list_raw = rpc_load_pokemon_list()
-        
-        # Check if has icons (3-tuples)
-        try:
-            has_icons = (pokemon_list_raw and isinstance(pokemon_list_raw[0], tuple) and 
-                         len(pokemon_list_raw[0]) == 3)
-        except (IndexError, TypeError):
-            has_icons = False
-        
-        if has_icons:
-            for pokemon_name, pokemon_id, icon_url in pokemon_list_raw:
-                pokemon_data.append({
-                    'original': pokemon_name,
-                    'formatted': format_pokemon_name(pokemon_name),
-                    'icon': None,
-                    'id': pokemon_id,
-                    'sprite': None
-                })
-        else:
-            for pokemon_name, pokemon_id in pokemon_list_raw:
-                pokemon_data.append({
-                    'original': pokemon_name,
-                    'formatted': format_pokemon_name(pokemon_name),
-                    'icon': None,
-                    'id': pokemon_id,
-                    'sprite': None
-                })
+        # Load Pokemon list (preloaded at startup)
+        pokemon_dataset = load_pokemon_dataset()
+        pokemon_data = pokemon_dataset.rows()
         
         def draw_grid_cell(canvas, pokemon, x, y, width, height):
             """Draw a single Pokemon grid cell with sprite and name"""
@@ -5772,18 +7951,15 @@ class ProfileTab:
                 width=1
             )
             
-            # Load sprite on-demand if not already loaded
-            if 'sprite' not in pokemon or pokemon['sprite'] is None:
-                sprite_image = load_pokemon_sprite(pokemon['original'], pokemon['id'])
-                if sprite_image:
-                    pokemon['sprite'] = sprite_image
-                    pokemon_grid_sprites.append(sprite_image)
+            # Load sprite on-demand; only visible cells hold one
+            sprite_image = POKEMON_SPRITES.photo(pokemon['icon_path'])
             
             # Draw sprite (128×128 centered in 130px cell)
-            if pokemon.get('sprite'):
+            if sprite_image:
+                pokemon_grid_sprites[pokemon['original']] = sprite_image
                 sprite_x = x + width // 2
                 sprite_y = y + 65  # Center 128px sprite vertically in 130px cell
-                canvas.create_image(sprite_x, sprite_y, image=pokemon['sprite'])
+                canvas.create_image(sprite_x, sprite_y, image=sprite_image)
             
             # Draw Pokemon name (bottom of cell)
             name_y = y + height - 10
@@ -5835,10 +8011,11 @@ class ProfileTab:
             )
             
             # Redraw sprite on orange background (128×128 in 130px cell)
-            if selected_pokemon.get('sprite'):
+            sprite_image = pokemon_grid_sprites.get(selected_pokemon['original'])
+            if sprite_image:
                 sprite_x = x + cell_width // 2
                 sprite_y = y + 65  # Center 128px sprite vertically in 130px cell
-                canvas.create_image(sprite_x, sprite_y, image=selected_pokemon['sprite'], tags="highlight")
+                canvas.create_image(sprite_x, sprite_y, image=sprite_image, tags="highlight")
             
             # Redraw Pokemon name in white
             name_y = y + cell_height - 10
@@ -5879,17 +8056,12 @@ class ProfileTab:
             canvas = pokemon_canvas
             
             canvas.delete("all")
+            pokemon_grid_sprites.clear()
             
             max_generation = current_game_generation
             
             # Filter by generation
-            filtered_by_gen = []
-            for pokemon in pokemon_data:
-                pokemon_id = pokemon.get('id', 0)
-                pokemon_gen = get_pokemon_generation(pokemon_id)
-                
-                if pokemon_gen <= max_generation:
-                    filtered_by_gen.append(pokemon)
+            filtered_by_gen = pokemon_data[:pokemon_dataset.generation_end(max_generation)]
             
             # Apply search filter
             if filter_text:
@@ -5932,6 +8104,9 @@ class ProfileTab:
                 
                 draw_grid_cell(canvas, pokemon, x, y, cell_width, cell_height)
             
+            # Decode the next few results in the background
+            POKEMON_SPRITES.prefetch(p['icon_path'] for p in filtered_pokemon[3:3 + POKEMON_SPRITE_PREFETCH])
+            
             # Select current target if matches
             if current_target:
                 for pokemon in filtered_pokemon:
@@ -5957,13 +8132,12 @@ class ProfileTab:
                 selected_game_id = selected_items[0]
                 
                 # Load config file for selected game to get all settings
-                config_path = os.path.join(RPC_CONFIG_FOLDER, f"{selected_game_id}.txt")
                 target_pokemon = ""
                 new_odds = 8192
                 new_suffix = "Encounters"
                 
                 try:
-                    cfg = rpc_read_config(config_path)
+                    cfg = rpc_get_game_config(selected_game_id)
                     target_pokemon = cfg.get("target", "")
                     new_odds = cfg.get("odds", 8192)
                     new_suffix = cfg.get("counter_suffix", "Encounters")
@@ -5994,14 +8168,10 @@ class ProfileTab:
                 initial_odds = new_odds
                 initial_suffix = new_suffix
                 
-                # Find game name and update generation
-                for game in game_data:
-                    if game['id'] == selected_game_id:
-                        current_game_generation = get_game_generation(game['name'])
-                        populate_pokemon_grid(pokemon_filter_entry.get())
-                        highlight_selected_pokemon()  # Highlight the selected Pokemon from config
-                        update_apply_button_color()
-                        break
+                current_game_generation = GAME_CATALOG.generation(selected_game_id)
+                populate_pokemon_grid(pokemon_filter_entry.get())
+                highlight_selected_pokemon()  # Highlight the selected Pokemon from config
+                update_apply_button_color()
         
         # Bind events
         pokemon_filter_entry.bind("<KeyRelease>", on_pokemon_filter_change)
@@ -6152,8 +8322,7 @@ class ProfileTab:
             selected_target = selected_pokemon_name
             if not selected_target and selected_game_id:
                 # Load current config to preserve existing target
-                config_path = os.path.join(os.path.dirname(__file__), "rpc_config", f"{selected_game_id}.txt")
-                cfg = rpc_read_config(config_path)
+                cfg = rpc_get_game_config(selected_game_id)
                 selected_target = cfg.get("target", "")
             
             # Validate that a target Pokemon is selected
@@ -6186,6 +8355,7 @@ class ProfileTab:
             self.rpc_target = selected_target
             self.rpc_odds = selected_odds
             self.rpc_counter_suffix = selected_suffix
+            PRESENCE.wake()  # Show the new target/odds without waiting for an encounter
             
             # Update main config (for instance variables persistence)
             self.update_config_value(CONFIG_KEY_RPC_GAME, self.rpc_game_id)
@@ -6197,12 +8367,11 @@ class ProfileTab:
             self.save_settings_silent()
             
             # ALSO save to the game-specific RPC config file
-            config_path = os.path.join(os.path.dirname(__file__), "rpc_config", f"{selected_game_id}.txt")
-            cfg = rpc_read_config(config_path)
+            cfg = rpc_get_game_config(selected_game_id)
             cfg["target"] = selected_target
             cfg["odds"] = selected_odds
             cfg["counter_suffix"] = selected_suffix
-            rpc_write_config(config_path, cfg)
+            rpc_save_game_config(selected_game_id, cfg)
             
             # Update initial values to match saved values so Apply button returns to gray
             initial_game_id = selected_game_id
@@ -6338,6 +8507,12 @@ class ProfileTab:
             self.cooldown_var.set(5)
             self.frequency_var.set(0.5)
             self.threshold_var.set(0.9)
+            self.count_instances_var.set(False)
+            self.match_method = MATCH_METHOD_TEMPLATE
+            self.capture_client_only = False
+            self.capture_crop = None
+            self.capture_scale = 1.0
+            self.refresh_detection_settings()
             
             self.count_plus_hotkey = ""
             self.count_minus_hotkey = ""
@@ -6383,6 +8558,11 @@ class ProfileTab:
             self.update_config_value(CONFIG_KEY_ALERT_PLAY_MANUAL, "1")
             self.update_config_value(CONFIG_KEY_ALERT_PLAY_HOTKEY, "1")
             self.update_config_value(CONFIG_KEY_ALERT_PLAY_AUTO, "1")
+            self.update_config_value(CONFIG_KEY_COUNT_INSTANCES, "0")
+            self.update_config_value(CONFIG_KEY_MATCH_METHOD, MATCH_METHOD_TEMPLATE)
+            self.update_config_value(CONFIG_KEY_CAPTURE_CLIENT_ONLY, "0")
+            self.update_config_value(CONFIG_KEY_CAPTURE_CROP, "")
+            self.update_config_value(CONFIG_KEY_CAPTURE_SCALE, "1.0")
             
             # Save settings and update UI state (fixes RPC checkbox defaulting to true)
             self.save_settings_silent()
@@ -6533,6 +8713,31 @@ class ProfileTab:
             wraplength=400
         )
         help_text.pack(pady=(5, 20))
+
+        # Capture diagnostics for this profile, click to copy them into a report
+        diagnostics_text = f"{getattr(self, 'profile_name', f'Profile {self.profile_index}')}\n" + "\n".join(self.get_diagnostics_lines())
+        diagnostics_label = tk.Label(
+            self._sub_setting_frame,
+            text=diagnostics_text,
+            bg=DARK_BG,
+            fg="#888888",
+            font=(FONT_NAME, BASE_FONT_SIZE - 2),
+            cursor="hand2",
+            justify="center",
+            wraplength=400
+        )
+        diagnostics_label.pack(pady=(0, 20))
+        add_tooltip(diagnostics_label, "Click to copy these details, so you can paste them into your bug report.")
+
+        def copy_diagnostics(event):
+            try:
+                top = self.frame.winfo_toplevel()
+                top.clipboard_clear()
+                top.clipboard_append(diagnostics_text)
+            except Exception:
+                pass
+
+        diagnostics_label.bind("<Button-1>", copy_diagnostics)
         
         # Back button at bottom - 420px wide standard button
         tk.Button(
@@ -6658,10 +8863,7 @@ class ProfileTab:
 
 
     def start_broadcast_async(self, game_id, target, odds):
-        global ACTIVE_BROADCAST_PROFILE
-
-        config_path = os.path.join(RPC_CONFIG_FOLDER, f"{game_id}.txt")
-        cfg = rpc_read_config(config_path)
+        cfg = rpc_get_game_config(game_id)
 
         if not cfg.get("application_id"):
             show_custom_error(
@@ -6679,89 +8881,50 @@ class ProfileTab:
             )
             return
 
-        self.rpc_stop_event.clear()
-
-        def loop():
-            while not self.rpc_stop_event.is_set():
-                try:
-                    with open(self.selected_text_path, "r") as f:
-                        encounters = int(f.readline() or 0)
-                except Exception:
-                    encounters = 0
-
-                conf, status = rpc_shiny_confidence(encounters, self.rpc_odds)
-                # Format Pokemon name for display (capitalize properly)
-                formatted_target = self.rpc_target.replace("-", " ").title() if self.rpc_target else ""
-                try:
-                    self.rpc.update(
-                        details=f"✦ {formatted_target} • {encounters} {self.rpc_counter_suffix or 'Encounters'}",
-                        state=f"{status} Confidence: {conf * 100:.2f}% ",
-                        large_image=cfg["icon"],
-                        large_text=cfg["game"]
-                    )
-                except Exception:
-                    pass
-
-                self.rpc_stop_event.wait(15)
+        counter_store = get_counter_store(self.selected_text_path)
 
-        def worker():
+        def get_hunt():
+            # Called from the presence thread
             try:
-                rpc = Presence(cfg["application_id"])
-                rpc.connect()
-            except Exception as exc:
-                self.frame.after(
-                    0,
-                    lambda: show_custom_error(
-                        "rpc_error",
-                        "Error ID 02098276: Unable to Connect",
-                        "Rotom is unable to connect to Discord. Please check your internet connection and that the Discord application is running."
-                    )
+                encounters = counter_store.get()
+            except Exception:
+                encounters = 0
+            self.hunt_stats.sync(encounters)
+            return {
+                "target": self.rpc_target,
+                "encounters": encounters,
+                "suffix": self.rpc_counter_suffix,
+                "odds": self.rpc_odds,
+                "probability": self.hunt_stats.snapshot(self.rpc_odds)["probability"],
+                "icon": cfg["icon"],
+                "game": cfg["game"],
+            }
+
+        def report_connect_failure():
+            self.frame.after(
+                0,
+                lambda: show_custom_error(
+                    "rpc_error",
+                    "Error ID 02098276: Unable to Connect",
+                    "Rotom is unable to connect to Discord. Please check your internet connection and that the Discord application is running."
                 )
-                return
-
-            def on_connected():
-                if self.rpc_stop_event.is_set():
-                    try:
-                        rpc.clear()
-                        rpc.close()
-                    except Exception:
-                        pass
-                    return
-
-                self.rpc = rpc
-                self.rpc_game_id = game_id
-                self.rpc_target = target
-                self.rpc_odds = odds
-                self.rpc_is_running = True
-                ACTIVE_BROADCAST_PROFILE = self.profile_index
-                self.rpc_thread = threading.Thread(target=loop, daemon=True)
-                self.rpc_thread.start()
-
-            self.frame.after(0, on_connected)
+            )
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.rpc_game_id = game_id
+        self.rpc_target = target
+        self.rpc_odds = odds
+        self.rpc_is_running = True
+        self.rpc_counter_store = counter_store
+        counter_store.add_listener(PRESENCE.wake)
+        PRESENCE.add(self.profile_index, cfg["application_id"], get_hunt, report_connect_failure)
 
     def stop_broadcast(self):
-        global ACTIVE_BROADCAST_PROFILE
-
-        self.rpc_stop_event.set()
-
-        if self.rpc_thread and self.rpc_thread.is_alive():
-            self.rpc_thread.join(timeout=0.5)
-
-        try:
-            if self.rpc:
-                self.rpc.clear()
-                self.rpc.close()
-        except Exception:
-            pass
-
-        self.rpc = None
+        if self.rpc_counter_store is not None:
+            self.rpc_counter_store.remove_listener(PRESENCE.wake)
+            self.rpc_counter_store = None
+        # The other profiles keep broadcasting; the activity is cleared once none are left
+        PRESENCE.remove(self.profile_index)
         self.rpc_is_running = False
-        self.rpc_last_stop_time = time.monotonic()
-
-        if ACTIVE_BROADCAST_PROFILE == self.profile_index:
-            ACTIVE_BROADCAST_PROFILE = None
 
     def stop_running_with_error(self, title, message):
         self.is_running = False
@@ -6783,6 +8946,55 @@ class ProfileTab:
                 "Some settings are missing or invalid."
             )
 
+    def build_detection_settings(self):
+        """Snapshot the current settings; call on the Tk thread."""
+        return DetectionSettings(
+            title=self.title_var.get().strip(),
+            frequency=max(0.1, float(self.frequency_var.get())),
+            cooldown=max(1.0, float(self.cooldown_var.get())),
+            threshold=float(self.threshold_var.get()),
+            count_instances=bool(self.count_instances_var.get()),
+            match_method=self.match_method,
+            image_path=self.selected_image_path,
+            capture_client_only=self.capture_client_only,
+            capture_crop=self.capture_crop,
+            capture_scale=self.capture_scale
+        )
+
+    def refresh_detection_settings(self, *_):
+        try:
+            self.detection_settings = self.build_detection_settings()
+        except (tk.TclError, ValueError):
+            pass  # A half-typed value; keep using the last good snapshot
+
+    def _grab_frame(self, hwnd, settings):
+        """Capture the window the way this profile is configured to (borders, capture area)."""
+        self.last_capture_hwnd = hwnd
+        return grab_window_image(
+            hwnd,
+            client_only=settings.capture_client_only,
+            crop=settings.capture_crop,
+            scale=settings.capture_scale
+        )
+
+    def _run_detection(self, screenshot_img, settings):
+        """Run the profile's detection method on a frame and return (match_count, confidence)."""
+        if settings.match_method == MATCH_METHOD_FEATURES:
+            if self.feature_matcher is None:
+                self.feature_matcher = FeatureMatcher()
+            is_match, confidence, _ = self.feature_matcher.compare(screenshot_img, settings.image_path)
+            return (1 if is_match else 0), confidence
+
+        match_count, confidence = compare_images(
+            screenshot_img,
+            settings.image_path,
+            threshold=settings.threshold,
+            count_instances=settings.count_instances,
+            scale=settings.capture_scale,
+            pool=self.buffer_pool
+        )
+        return int(match_count), confidence
+
     def auto_check_loop(self):
         if not self.is_running:
             return
@@ -6790,18 +9002,21 @@ class ProfileTab:
         if not self.auto_count_var.get():
             return
 
-        is_valid, increment_amount = self.validate_required_inputs(show_popup=True)
+        is_valid, increment_amount = self._cached_validation()
         if not is_valid:
             self.stop_running_with_error("Invalid Settings", "Please fix the missing or invalid settings.")
             return
 
-        frequency_seconds = max(0.1, float(self.frequency_var.get()))
-        cooldown_seconds = max(1.0, float(self.cooldown_var.get()))
-        threshold = float(self.threshold_var.get())
+        settings = self.detection_settings
+        if settings is None:
+            self.refresh_detection_settings()
+            settings = self.detection_settings
 
-        self.frame.after(int(frequency_seconds * 1000), self.auto_check_loop)
+        # Backs off while captures are stalling, see DetectionWatchdog
+        next_tick = self.detection_watchdog.next_interval(settings.frequency)
+        self.frame.after(int(next_tick * 1000), self.auto_check_loop)
 
-        title = self.title_var.get().strip()
+        title = settings.title
         if not title:
             self.stop_running_with_error("Invalid Window Title", "Please enter an OBS window title.")
             return
@@ -6816,20 +9031,56 @@ class ProfileTab:
             return
 
         now = time.monotonic()
-        if now - self.last_match_time < cooldown_seconds:
+        if now - self.last_match_time < settings.cooldown:
             return
 
+        def detect():
+            # Runs on the watchdog's thread: no Tk calls in here
+            screenshot_img = self._grab_frame(hwnd, settings)
+            return self._run_detection(screenshot_img, settings)
+
+        self.detection_watchdog.submit(
+            detect,
+            on_done=lambda result: self._on_auto_detection(result, increment_amount, now)
+        )
+
+    def _on_auto_detection(self, result, increment_amount, tick_time):
+        match_count, confidence = result
+        if not self.is_running or not match_count:
+            return
+        amount = int(match_count) * increment_amount
         try:
-            screenshot_img = grab_window_image(hwnd)
-            is_match, _ = compare_images(screenshot_img, self.selected_image_path, threshold=threshold)
-            if is_match:
-                new_value = increment_number_in_file(self.selected_text_path, increment_amount)
-                self.last_match_time = now
-                self.lbl_current_count.config(text=str(new_value))
-                if self._should_play_alert_for("auto"):
-                    self._maybe_play_alert()
+            # Horde / double battles: every instance on screen counts as an encounter
+            new_value = get_counter_store(self.selected_text_path).add(amount)
         except Exception:
             return
+        self._record_encounter("auto", amount, new_value, confidence)
+        self.hunt_stats.observe(amount, new_value)
+        self.last_match_time = tick_time
+        self.lbl_current_count.config(text=str(new_value))
+        if self._should_play_alert_for("auto"):
+            self._maybe_play_alert()
+
+    def _record_encounter(self, source, delta, count, confidence=None):
+        ENCOUNTER_HISTORY.record(
+            self.profile_index,
+            source,
+            delta,
+            count,
+            confidence=confidence,
+            game=self.rpc_game_id,
+            target=self.rpc_target
+        )
+
+    def get_diagnostics_lines(self):
+        """Capture health for this profile, shown in the Report a Bug view."""
+        settings = self.detection_settings
+        client_only = settings.capture_client_only if settings else False
+        method = get_capture_method(self.last_capture_hwnd, client_only) if self.last_capture_hwnd else None
+        lines = [f"Capture method: {method or 'not captured yet'}"]
+        lines.extend(self.detection_watchdog.describe())
+        lines.append(self.buffer_pool.describe())
+        return lines
 
     def open_configure_window(self, parent_grab=None):
         if self.configure_window and self.configure_window.winfo_exists():
@@ -6899,13 +9150,19 @@ class ProfileTab:
 
         lbl_threshold = tk.Label(self.configure_window, text="Match Threshold (%):")
         lbl_threshold.grid(row=4, column=0, sticky="w", padx=12, pady=6)
-        add_tooltip(lbl_threshold, "When auto is enabled and I am searching the capture window, this is how confident I need to be that it matches the reference frame, before I increment the counter.")
+        if self.match_method == MATCH_METHOD_FEATURES:
+            add_tooltip(lbl_threshold, "Layout-tolerant detection is on, so I count one encounter whenever enough shapes line up and this threshold doesn't apply.")
+        else:
+            add_tooltip(lbl_threshold, "When auto is enabled and I am searching the capture window, this is how confident I need to be that it matches the reference frame, before I increment the counter.")
 
         threshold_slider = tk.Scale(
             self.configure_window, from_=0.5, to=1.0, resolution=0.01, orient="horizontal", 
             variable=temp_threshold_var, command=lambda v: on_slider_change()
         )
         threshold_slider.grid(row=5, column=0, padx=12, pady=4, sticky="we")
+        if self.match_method == MATCH_METHOD_FEATURES:
+            # Layout-tolerant detection decides on its own (enough matching shapes), see open_configure_inline
+            threshold_slider.config(state="disabled")
 
         slider_defaults = {
             cooldown_slider: (
@@ -6959,6 +9216,8 @@ class ProfileTab:
 
         def bind_scale_click(slider):
             def set_from_event(event):
+                if str(slider.cget("state")) == "disabled":
+                    return None
                 slider.update_idletasks()
                 width = slider.winfo_width() or slider.winfo_reqwidth()
                 if width <= 0:
@@ -7082,11 +9341,21 @@ class ProfileTab:
         initial_cooldown = self.cooldown_var.get()
         initial_frequency = self.frequency_var.get()
         initial_threshold = self.threshold_var.get()
+        initial_count_instances = self.count_instances_var.get()
+        initial_use_features = self.match_method == MATCH_METHOD_FEATURES
+        initial_client_only = self.capture_client_only
+        scale_to_label = {value: label for label, value in CAPTURE_SCALE_OPTIONS}
+        label_to_scale = {label: value for label, value in CAPTURE_SCALE_OPTIONS}
+        initial_scale_label = scale_to_label.get(self.capture_scale, "Full")
 
         # Create temporary variables to track changes
         temp_cooldown_var = tk.IntVar(value=initial_cooldown)
         temp_frequency_var = tk.DoubleVar(value=initial_frequency)
         temp_threshold_var = tk.DoubleVar(value=initial_threshold)
+        temp_count_instances_var = tk.BooleanVar(value=initial_count_instances)
+        temp_use_features_var = tk.BooleanVar(value=initial_use_features)
+        temp_client_only_var = tk.BooleanVar(value=initial_client_only)
+        temp_scale_var = tk.StringVar(value=initial_scale_label)
 
         def check_for_changes():
             if temp_cooldown_var.get() != initial_cooldown:
@@ -7095,6 +9364,14 @@ class ProfileTab:
                 return True
             if temp_threshold_var.get() != initial_threshold:
                 return True
+            if temp_count_instances_var.get() != initial_count_instances:
+                return True
+            if temp_use_features_var.get() != initial_use_features:
+                return True
+            if temp_client_only_var.get() != initial_client_only:
+                return True
+            if temp_scale_var.get() != initial_scale_label:
+                return True
             return False
 
         def update_apply_button_color():
@@ -7137,6 +9414,79 @@ class ProfileTab:
         )
         threshold_slider.pack(fill="x", pady=(0, 8))
 
+        count_instances_check = tk.Checkbutton(
+            content_frame,
+            text="Count every match in frame",
+            variable=temp_count_instances_var,
+            command=lambda: update_apply_button_color(),
+            takefocus=0
+        )
+        count_instances_check.pack(anchor="w", pady=(0, 8))
+        add_tooltip(count_instances_check, "For hordes and double battles: when the reference frame appears several times at once, I'll increment the counter once for each match.")
+
+        def update_feature_controls():
+            # Layout-tolerant detection decides on its own (enough matching shapes) and counts once per frame
+            state = "disabled" if temp_use_features_var.get() else "normal"
+            threshold_slider.config(state=state)
+            count_instances_check.config(state=state)
+
+        def on_use_features_change():
+            update_feature_controls()
+            update_apply_button_color()
+
+        use_features_check = tk.Checkbutton(
+            content_frame,
+            text="Layout-tolerant detection",
+            variable=temp_use_features_var,
+            command=on_use_features_change,
+            takefocus=0
+        )
+        use_features_check.pack(anchor="w", pady=(0, 8))
+        add_tooltip(use_features_check, "I'll match shapes in the reference frame instead of exact pixels, so it keeps working when you resize or crop your OBS layout. While this is on, I count one encounter whenever enough shapes line up, so Match Threshold and Count every match don't apply. Use Test Image to compare its speed and accuracy first.")
+        update_feature_controls()
+
+        client_only_check = tk.Checkbutton(
+            content_frame,
+            text="Ignore window borders",
+            variable=temp_client_only_var,
+            command=lambda: update_apply_button_color(),
+            takefocus=0
+        )
+        client_only_check.pack(anchor="w", pady=(0, 8))
+        add_tooltip(client_only_check, "I'll only capture the inside of the window, skipping the title bar and borders. Existing reference frames and capture areas keep working.")
+
+        style = ttk.Style()
+        style.configure(
+            "Rpc.TCombobox",
+            font=(FONT_NAME, BASE_FONT_SIZE),
+            fieldbackground=DARK_ACCENT,
+            background=DARK_ACCENT,
+            foreground=DARK_FG,
+            arrowcolor=DARK_FG
+        )
+        style.map(
+            "Rpc.TCombobox",
+            fieldbackground=[("readonly", DARK_ACCENT)],
+            background=[("readonly", DARK_ACCENT)],
+            foreground=[("readonly", DARK_FG)]
+        )
+
+        scale_row = tk.Frame(content_frame, bg=DARK_BG)
+        scale_row.pack(anchor="w", pady=(0, 8))
+        lbl_scale = tk.Label(scale_row, text="Capture Resolution:", bg=DARK_BG)
+        lbl_scale.pack(side="left", padx=(0, 8))
+        add_tooltip(lbl_scale, "Lower resolutions are faster to capture and search. Your reference frame is scaled down to match. Use Test Image to compare against full size before relying on it.")
+        scale_combo = ttk.Combobox(
+            scale_row,
+            textvariable=temp_scale_var,
+            values=[label for label, _ in CAPTURE_SCALE_OPTIONS],
+            state="readonly",
+            width=8,
+            style="Rpc.TCombobox"
+        )
+        scale_combo.pack(side="left")
+        scale_combo.bind("<<ComboboxSelected>>", lambda e: update_apply_button_color())
+
         slider_defaults = {
             cooldown_slider: (
                 DARK_BG,
@@ -7189,6 +9539,8 @@ class ProfileTab:
 
         def bind_scale_click(slider):
             def set_from_event(event):
+                if str(slider.cget("state")) == "disabled":
+                    return None
                 slider.update_idletasks()
                 width = slider.winfo_width() or slider.winfo_reqwidth()
                 if width <= 0:
@@ -7242,13 +9594,29 @@ class ProfileTab:
             self._update_test_image_button_color(START_ACTIVE_COLOR)
 
         def apply_changes():
-            nonlocal initial_cooldown, initial_frequency, initial_threshold
+            nonlocal initial_cooldown, initial_frequency, initial_threshold, initial_count_instances, initial_use_features
+            nonlocal initial_client_only, initial_scale_label
             self.cooldown_var.set(temp_cooldown_var.get())
             self.frequency_var.set(temp_frequency_var.get())
             self.threshold_var.set(temp_threshold_var.get())
+            self.count_instances_var.set(temp_count_instances_var.get())
             initial_cooldown = temp_cooldown_var.get()
             initial_frequency = temp_frequency_var.get()
             initial_threshold = temp_threshold_var.get()
+            initial_count_instances = temp_count_instances_var.get()
+            self.match_method = MATCH_METHOD_FEATURES if temp_use_features_var.get() else MATCH_METHOD_TEMPLATE
+            if temp_use_features_var.get() != initial_use_features:
+                self.mark_dirty()
+            initial_use_features = temp_use_features_var.get()
+            if temp_client_only_var.get() != initial_client_only:
+                self.capture_client_only = temp_client_only_var.get()
+                self.mark_dirty()
+            initial_client_only = temp_client_only_var.get()
+            if temp_scale_var.get() != initial_scale_label:
+                self.capture_scale = label_to_scale.get(temp_scale_var.get(), 1.0)
+                self.mark_dirty()
+            initial_scale_label = temp_scale_var.get()
+            self.refresh_detection_settings()
             update_apply_button_color()
             refresh_slider_colors()
 
@@ -7292,6 +9660,50 @@ class ProfileTab:
             self.profile_name_var.set(saved_profile_name[:PROFILE_NAME_MAX_LENGTH])
         self.set_tab_title()
 
+        self._apply_detection_settings()
+
+        self.rpc_game_id = self.load_config_value(CONFIG_KEY_RPC_GAME, "")
+        self.rpc_target = self.load_config_value(CONFIG_KEY_RPC_TARGET, "")
+        rpc_odds = self.load_config_value(CONFIG_KEY_RPC_ODDS, "8192")
+        try:
+            self.rpc_odds = int(rpc_odds)
+        except ValueError:
+            self.rpc_odds = 8192
+
+        # Always start with RPC disabled, regardless of saved config
+        self.rpc_enabled = False
+        self.rpc_enabled_var.set(False)
+
+        rpc_suffix = self.load_config_value(CONFIG_KEY_RPC_SUFFIX, "Encounters")
+        self.rpc_counter_suffix = rpc_suffix or "Encounters"
+
+        self.count_plus_hotkey = normalize_hotkey_display(
+            self.load_config_value(CONFIG_KEY_COUNT_PLUS, "")
+        )
+        self.count_minus_hotkey = normalize_hotkey_display(
+            self.load_config_value(CONFIG_KEY_COUNT_MINUS, "")
+        )
+
+        self.alert_sound_file = self.load_config_value(CONFIG_KEY_ALERT_SOUND, "Notify.wav")
+        if not self.alert_sound_file and os.path.isfile(os.path.join(ALERTS_AUDIO_FOLDER, "Notify.wav")):
+            self.alert_sound_file = "Notify.wav"
+            self.update_config_value(CONFIG_KEY_ALERT_SOUND, self.alert_sound_file)
+
+        # Always start with alerts disabled, regardless of saved config
+        self.audio_enabled_var.set(False)
+        self.audio_enabled = False
+        self.alert_play_manual = self.load_config_value(CONFIG_KEY_ALERT_PLAY_MANUAL, "1") == "1"
+        self.alert_play_hotkey = self.load_config_value(CONFIG_KEY_ALERT_PLAY_HOTKEY, "1") == "1"
+        self.alert_play_auto = self.load_config_value(CONFIG_KEY_ALERT_PLAY_AUTO, "1") == "1"
+
+        self._last_text_path = self.selected_text_path
+        self._loading_config = False
+        
+        # Update button text after config is loaded
+        self._update_manual_buttons()
+
+    def _apply_detection_settings(self):
+        """Window, reference, counter file and detection tuning. The auto loop reads these every tick."""
         saved_title = self.load_config_value(CONFIG_KEY_TITLE, "")
         if saved_title:
             self.title_var.set(saved_title)
@@ -7322,6 +9734,22 @@ class ProfileTab:
         except ValueError:
             self.threshold_var.set(0.9)
 
+        self.count_instances_var.set(self.load_config_value(CONFIG_KEY_COUNT_INSTANCES, "0") == "1")
+        match_method = self.load_config_value(CONFIG_KEY_MATCH_METHOD, MATCH_METHOD_TEMPLATE)
+        if match_method not in (MATCH_METHOD_TEMPLATE, MATCH_METHOD_FEATURES):
+            match_method = MATCH_METHOD_TEMPLATE
+        self.match_method = match_method
+        self.capture_client_only = self.load_config_value(CONFIG_KEY_CAPTURE_CLIENT_ONLY, "0") == "1"
+        self.capture_crop = parse_capture_crop(self.load_config_value(CONFIG_KEY_CAPTURE_CROP, ""))
+        try:
+            capture_scale = float(self.load_config_value(CONFIG_KEY_CAPTURE_SCALE, "1.0"))
+        except ValueError:
+            capture_scale = 1.0
+        if capture_scale not in [value for _, value in CAPTURE_SCALE_OPTIONS]:
+            capture_scale = 1.0
+        self.capture_scale = capture_scale
+        self.refresh_detection_settings()
+
         increment = self.load_config_value(CONFIG_KEY_INCREMENT, str(MIN_INCREMENT))
         try:
             increment_value = int(increment)
@@ -7330,45 +9758,561 @@ class ProfileTab:
         increment_value = self._sanitize_increment_value(increment_value)
         self.increment_var.set(str(increment_value))
 
-        self.rpc_game_id = self.load_config_value(CONFIG_KEY_RPC_GAME, "")
-        self.rpc_target = self.load_config_value(CONFIG_KEY_RPC_TARGET, "")
-        rpc_odds = self.load_config_value(CONFIG_KEY_RPC_ODDS, "8192")
+    def reload_from_settings(self):
+        """Apply settings.json edits made outside the app; safe while detection is running."""
+        self._loading_config = True
+        saved_profile_name = self.load_config_value(CONFIG_KEY_PROFILE_NAME, "")
+        if saved_profile_name:
+            self.profile_name_var.set(saved_profile_name[:PROFILE_NAME_MAX_LENGTH])
+        self.set_tab_title()
+        self._apply_detection_settings()
+        self._last_text_path = self.selected_text_path
+        self._loading_config = False
+        self._update_manual_buttons()
+
+
+# =========================
+# BENCHMARKS
+# =========================
+def bench_match(frame_path, template_path, runs="20"):
+    """Compare template and feature matching on a saved frame: --bench-match FRAME REFERENCE [RUNS]"""
+    screenshot_img = Image.open(frame_path).convert("RGBA")
+    results = benchmark_match_methods(screenshot_img, template_path, runs=int(runs))
+    for method, result in results.items():
+        if "error" in result:
+            print(f"{method:<9} error: {result['error']}")
+            continue
+        extra = f" inliers={result['inliers']}" if "inliers" in result else ""
+        print(
+            f"{method:<9} match={'yes' if result['match'] else 'no ':<3} "
+            f"confidence={result['confidence']:.3f}{extra}  {result['ms']:.2f} ms/tick"
+        )
+    return 0
+
+
+def bench_scale(frame_path, template_path, runs="20"):
+    """Compare template matching at each capture resolution: --bench-scale FRAME REFERENCE [RUNS]"""
+    frame = Image.open(frame_path).convert("RGBA")
+    runs = int(runs)
+    for label, scale in CAPTURE_SCALE_OPTIONS:
+        # Box filtering stands in for the HALFTONE stretch done at capture time
+        size = (max(1, int(round(frame.width * scale))), max(1, int(round(frame.height * scale))))
+        screenshot_img = frame if scale == 1.0 else frame.resize(size, Image.BOX)
+        compare_images(screenshot_img, template_path, scale=scale)  # Warm the template cache
+        start = time.perf_counter()
+        for _ in range(runs):
+            is_match, confidence = compare_images(screenshot_img, template_path, scale=scale)
+        elapsed = (time.perf_counter() - start) * 1000 / runs
+        print(
+            f"{label:<8} {size[0]}x{size[1]:<5} match={'yes' if is_match else 'no ':<3} "
+            f"confidence={confidence:.3f}  {elapsed:.2f} ms/tick"
+        )
+    return 0
+
+
+class _FakeGdi:
+    """
+    In-memory stand-in for the user32/gdi32 calls used by grab_window_image.
+
+    Tracks every handle it gives out and fails calls at random (returning 0 or raising,
+    like the real API does) so the soak benchmark can check that nothing is leaked.
+    """
+
+    NAMES = (
+        "GetWindowRect", "GetClientRect", "ClientToScreen", "GetDC", "GetWindowDC", "ReleaseDC",
+        "PrintWindow", "CreateCompatibleDC", "CreateCompatibleBitmap", "SelectObject",
+        "DeleteObject", "DeleteDC", "GetDIBits", "BitBlt", "StretchBlt", "SetStretchBltMode",
+        "SetBrushOrgEx", "IsWindow",
+    )
+    STOCK_BITMAP = -1
+    CLIENT_OFFSET = (8, 31)
+
+    def __init__(self, width, height, failure_rate, seed=0):
+        self.width = width
+        self.height = height
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.live = set()
+        self.selected = {}
+        self.deleted_while_selected = 0
+        self.invalid_releases = 0
+        self.failures = 0
+        self._next_handle = 1
+
+    def _fail(self):
+        if self.random.random() < self.failure_rate:
+            self.failures += 1
+            return True
+        return False
+
+    def _new_handle(self):
+        handle = self._next_handle
+        self._next_handle += 1
+        self.live.add(handle)
+        return handle
+
+    def _free(self, handle):
+        if handle not in self.live:
+            self.invalid_releases += 1
+            return 0
+        self.live.remove(handle)
+        return 1
+
+    def GetWindowRect(self, hwnd, rect_ref):
+        rect = rect_ref._obj
+        rect.left, rect.top, rect.right, rect.bottom = 0, 0, self.width, self.height
+        return 1
+
+    def GetClientRect(self, hwnd, rect_ref):
+        rect = rect_ref._obj
+        rect.left, rect.top = 0, 0
+        rect.right = self.width - 2 * self.CLIENT_OFFSET[0]
+        rect.bottom = self.height - self.CLIENT_OFFSET[1] - self.CLIENT_OFFSET[0]
+        return 1
+
+    def ClientToScreen(self, hwnd, point_ref):
+        point_ref._obj.x, point_ref._obj.y = self.CLIENT_OFFSET
+        return 1
+
+    def GetDC(self, hwnd):
+        return 0 if self._fail() else self._new_handle()
+
+    GetWindowDC = GetDC
+
+    def ReleaseDC(self, hwnd, dc):
+        return self._free(dc)
+
+    def CreateCompatibleDC(self, dc):
+        return 0 if self._fail() else self._new_handle()
+
+    def CreateCompatibleBitmap(self, dc, width, height):
+        return 0 if self._fail() else self._new_handle()
+
+    def SelectObject(self, dc, obj):
+        previous = self.selected.get(dc, self.STOCK_BITMAP)
+        self.selected[dc] = obj
+        return previous
+
+    def DeleteObject(self, obj):
+        if obj in self.selected.values():
+            # Real GDI refuses this and the bitmap leaks
+            self.deleted_while_selected += 1
+            return 0
+        return self._free(obj)
+
+    def DeleteDC(self, dc):
+        self.selected.pop(dc, None)
+        return self._free(dc)
+
+    def PrintWindow(self, hwnd, dc, flags):
+        return 0 if self._fail() else 1
+
+    def GetDIBits(self, dc, bitmap, start, lines, buffer, bmi_ref, usage):
+        if self._fail():
+            return 0
+        ctypes.memset(buffer, 0x40, len(buffer))
+        return lines
+
+    def BitBlt(self, *args):
+        if self._fail():
+            raise OSError("Injected BitBlt failure.")
+        return 1
+
+    def StretchBlt(self, *args):
+        if self._fail():
+            raise OSError("Injected StretchBlt failure.")
+        return 1
+
+    def SetStretchBltMode(self, dc, mode):
+        return 1
+
+    def SetBrushOrgEx(self, dc, x, y, point):
+        return 1
+
+    def IsWindow(self, hwnd):
+        return 1
+
+
+def bench_capture_soak(cycles="1000000", failure_rate="0.05"):
+    """Soak test the capture path against a fake GDI with injected failures: --bench-capture-soak [CYCLES] [FAILURE_RATE]"""
+    cycles = max(1, int(cycles))
+    fake = _FakeGdi(160, 120, float(failure_rate))
+    # Full window, client area with a capture area, and a half-resolution capture
+    variants = [(False, None, 1.0), (True, (20, 40, 64, 32), 1.0), (False, None, 0.5)]
+
+    module_globals = globals()
+    missing = object()
+    saved = {name: module_globals.get(name, missing) for name in _FakeGdi.NAMES}
+    saved_methods = dict(_capture_methods)
+    module_globals.update({name: getattr(fake, name) for name in _FakeGdi.NAMES})
+    # tracemalloc roughly triples the cost of a cycle, so memory is only traced over the last
+    # stretch of the run (after a short warmup); handles are checked on every cycle.
+    trace_start = max(0, cycles - 100000)
+    baseline_at = trace_start + min(10000, (cycles - trace_start) // 10)
+    baseline = 0
+    try:
+        errors = 0
+        leaked_at = None
+        start = time.perf_counter()
+        for cycle in range(cycles):
+            if cycle == trace_start:
+                tracemalloc.start()
+            if cycle == baseline_at:
+                baseline = tracemalloc.get_traced_memory()[0]
+            client_only, crop, scale = variants[cycle % len(variants)]
+            try:
+                grab_window_image(1, client_only=client_only, crop=crop, scale=scale)
+            except (RuntimeError, OSError):
+                errors += 1
+            if fake.live or any(CaptureResources.live_counts().values()):
+                leaked_at = cycle
+                break
+            if cycle and cycle % 250000 == 0:
+                print(f"{cycle} cycles, {errors} failed captures")
+        elapsed = time.perf_counter() - start
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+        for name, value in saved.items():
+            if value is missing:
+                module_globals.pop(name, None)
+            else:
+                module_globals[name] = value
+        _capture_methods.clear()
+        _capture_methods.update(saved_methods)
+
+    print(f"cycles={cycle + 1} failed={errors} injected={fake.failures} {elapsed * 1e6 / (cycle + 1):.1f} us/cycle")
+    print(f"open handles={len(fake.live)} live={CaptureResources.live_counts()}")
+    print(f"deleted while selected={fake.deleted_while_selected} invalid releases={fake.invalid_releases}")
+    print(f"memory growth after warmup={growth:+d} bytes")
+
+    ok = (
+        leaked_at is None
+        and not fake.deleted_while_selected
+        and not fake.invalid_releases
+        and growth < 256 * 1024
+    )
+    if leaked_at is not None:
+        print(f"FAIL: resources still open after cycle {leaked_at}")
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+class _FakeDiscordIPC:
+    """
+    Stand-in for the Discord client's IPC socket (Linux/macOS), used by --bench-rpc.
+
+    Speaks the handshake and SET_ACTIVITY frames pypresence sends and records every activity.
+    Responses can be delayed, open connections dropped, new connections refused and, with a
+    rate limit set, activities past Discord's limit answered with an error frame.
+    """
+
+    OP_HANDSHAKE = 0
+    OP_FRAME = 1
+    OP_CLOSE = 2
+
+    def __init__(self, folder, latency=0.0, rate_limit=None):
+        self.path = os.path.join(folder, "discord-ipc-0")
+        self.latency = latency
+        self.rate_limit = rate_limit  # TokenBucket, or None to accept everything
+        self.refuse_connections = 0
+        self.activities = []          # (time.monotonic(), activity dict or None for a clear)
+        self.connections = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._clients = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(8)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            with self._lock:
+                if self.refuse_connections:
+                    self.refuse_connections -= 1
+                    client.close()
+                    continue
+                self.connections += 1
+                self._clients.append(client)
+            threading.Thread(target=self._serve, args=(client,), daemon=True).start()
+
+    @staticmethod
+    def _recv_exact(client, size):
+        data = b""
+        while len(data) < size:
+            chunk = client.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _send(self, client, op, payload):
+        body = json.dumps(payload).encode("utf-8")
+        client.sendall(struct.pack("<II", op, len(body)) + body)
+
+    def _serve(self, client):
         try:
-            self.rpc_odds = int(rpc_odds)
-        except ValueError:
-            self.rpc_odds = 8192
+            while True:
+                header = self._recv_exact(client, 8)
+                if header is None:
+                    return
+                op, length = struct.unpack("<II", header)
+                body = self._recv_exact(client, length)
+                if body is None:
+                    return
+                message = json.loads(body.decode("utf-8"))
+                if op == self.OP_CLOSE:
+                    return
+                if self.latency:
+                    time.sleep(self.latency)
+                if op == self.OP_HANDSHAKE:
+                    self._send(client, self.OP_FRAME, {
+                        "cmd": "DISPATCH",
+                        "evt": "READY",
+                        "data": {"v": 1, "user": {"id": "0", "username": "bench"}},
+                        "nonce": None,
+                    })
+                    continue
+                nonce = message.get("nonce")
+                if message.get("cmd") != "SET_ACTIVITY":
+                    self._send(client, self.OP_FRAME, {"cmd": message.get("cmd"), "evt": None, "data": {}, "nonce": nonce})
+                    continue
+                activity = message.get("args", {}).get("activity")
+                if self.rate_limit is not None and self.rate_limit.reserve() > 0:
+                    with self._lock:
+                        self.rejected += 1
+                    self._send(client, self.OP_FRAME, {
+                        "cmd": "SET_ACTIVITY",
+                        "evt": "ERROR",
+                        "data": {"code": 1000, "message": "You are being rate limited."},
+                        "nonce": nonce,
+                    })
+                    continue
+                with self._lock:
+                    self.activities.append((time.monotonic(), activity))
+                self._send(client, self.OP_FRAME, {"cmd": "SET_ACTIVITY", "evt": None, "data": activity, "nonce": nonce})
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                if client in self._clients:
+                    self._clients.remove(client)
+            client.close()
+
+    def drop_connections(self):
+        """Close every open connection, like Discord restarting."""
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
-        # Always start with RPC disabled, regardless of saved config
-        self.rpc_enabled = False
-        self.rpc_enabled_var.set(False)
+    def close(self):
+        self.drop_connections()
+        self._server.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
 
-        rpc_suffix = self.load_config_value(CONFIG_KEY_RPC_SUFFIX, "Encounters")
-        self.rpc_counter_suffix = rpc_suffix or "Encounters"
 
-        self.count_plus_hotkey = normalize_hotkey_display(
-            self.load_config_value(CONFIG_KEY_COUNT_PLUS, "")
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_rpc(updates="200", latency_ms="0", cycles="50"):
+    """Exercise the Discord connection code against a fake IPC server: --bench-rpc [UPDATES] [LATENCY_MS] [CYCLES]"""
+    if Presence is None:
+        print("pypresence is not installed.")
+        return 1
+    if not hasattr(socket, "AF_UNIX") or os.name == "nt":
+        print("--bench-rpc needs Unix sockets (Linux or macOS).")
+        return 1
+
+    updates = max(1, int(updates))
+    cycles = max(1, int(cycles))
+    folder = tempfile.mkdtemp(prefix="rotom-ipc-")
+    saved_runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    os.environ["XDG_RUNTIME_DIR"] = folder  # Where pypresence looks for discord-ipc-*
+    server = _FakeDiscordIPC(folder, latency=float(latency_ms) / 1000)
+    manager = DiscordConnectionManager()
+    wake = threading.Event()
+    ok = True
+
+    def wait_for(condition, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            wake.wait(0.01)
+            wake.clear()
+        return True
+
+    try:
+        start = time.perf_counter()
+        connection = manager.acquire("bench", 1, wake.set)
+        if not wait_for(lambda: connection.connected):
+            print("FAIL: never connected to the fake IPC server")
+            return 1
+        print(f"connect: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        latencies = []
+        for i in range(updates):
+            start = time.perf_counter()
+            if not connection.update(1, {"details": f"bench {i}", "state": "update latency"}):
+                ok = False
+            latencies.append((time.perf_counter() - start) * 1000)
+        print(
+            f"update latency over {updates}: p50={_percentile(latencies, 0.5):.2f} ms "
+            f"p95={_percentile(latencies, 0.95):.2f} ms max={max(latencies):.2f} ms"
         )
-        self.count_minus_hotkey = normalize_hotkey_display(
-            self.load_config_value(CONFIG_KEY_COUNT_MINUS, "")
+
+        # Discord restarting: the next update fails and the connection comes back on its own
+        generation = connection.generation
+        server.refuse_connections = 2
+        server.drop_connections()
+        start = time.perf_counter()
+        connection.update(1, {"details": "after drop", "state": "reconnect"})
+        if not wait_for(lambda: connection.generation > generation, timeout=30.0):
+            print("FAIL: did not reconnect after the server dropped the connection")
+            ok = False
+        else:
+            print(f"reconnect after drop (2 refused attempts): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # Rate limiting: rejected updates must not tear down the connection
+        server.rate_limit = TokenBucket(PRESENCE_UPDATE_LIMIT, PRESENCE_UPDATE_WINDOW)
+        generation = connection.generation
+        accepted = sum(connection.update(1, {"details": f"burst {i}", "state": "rate limit"}) for i in range(20))
+        server.rate_limit = None
+        print(f"burst of 20 against a {PRESENCE_UPDATE_LIMIT}/{PRESENCE_UPDATE_WINDOW:.0f}s limit: accepted={accepted} rejected={server.rejected}")
+        if connection.generation != generation or not connection.connected:
+            print("FAIL: a rate-limit error dropped the connection")
+            ok = False
+
+        # Rapid start/stop, alternating between two profiles
+        connections_before = server.connections
+        start = time.perf_counter()
+        for cycle in range(cycles):
+            owner = 1 + cycle % 2
+            connection = manager.acquire("bench", owner, wake.set)
+            if not wait_for(lambda: connection.connected):
+                ok = False
+                break
+            connection.update(owner, {"details": f"cycle {cycle}", "state": "start/stop"})
+            connection.release(owner)
+        elapsed = time.perf_counter() - start
+        new_connections = server.connections - connections_before
+        print(f"start/stop: {cycles} cycles, {elapsed * 1000 / cycles:.2f} ms/cycle, {new_connections} new IPC connections")
+        if new_connections:
+            ok = False
+
+        # Three profiles through the compositor share one connection and one activity
+        compositor = PresenceCompositor(manager)
+        compositor.set_mode(PRESENCE_MODE_SUMMARY)
+        connections_before = server.connections
+        recorded = len(server.activities)
+        for index in range(3):
+            hunt = {
+                "target": "rotom", "encounters": 1000 * (index + 1), "suffix": "Encounters", "odds": 8192,
+                "probability": 0.1 * (index + 1), "icon": "icon", "game": "Bench",
+            }
+            compositor.add(index + 1, "bench", lambda hunt=hunt: hunt)
+        summary_shown = wait_for(lambda: any(
+            activity and activity.get("details", "").startswith("✦ 3 hunts")
+            for _, activity in server.activities[recorded:]
+        ))
+        compositor.close()
+        print(
+            f"compositor: summary {'shown' if summary_shown else 'NOT shown'}, "
+            f"{server.connections - connections_before} new IPC connections, "
+            f"{len(server.activities) - recorded} activities sent"
         )
+        if not summary_shown or server.connections != connections_before:
+            ok = False
+        print(f"activities recorded by the fake server: {len(server.activities)}")
+    finally:
+        manager.close_all()
+        server.close()
+        if saved_runtime_dir is None:
+            os.environ.pop("XDG_RUNTIME_DIR", None)
+        else:
+            os.environ["XDG_RUNTIME_DIR"] = saved_runtime_dir
+        try:
+            os.rmdir(folder)
+        except OSError:
+            pass
 
-        self.alert_sound_file = self.load_config_value(CONFIG_KEY_ALERT_SOUND, "Notify.wav")
-        if not self.alert_sound_file and os.path.isfile(os.path.join(ALERTS_AUDIO_FOLDER, "Notify.wav")):
-            self.alert_sound_file = "Notify.wav"
-            self.update_config_value(CONFIG_KEY_ALERT_SOUND, self.alert_sound_file)
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+def build_sprite_atlas(output=POKEMON_SPRITE_ATLAS_PATH, runs="3"):
+    """Pack assets/pokemon_icons into one sprite atlas and time it against the loose files: --build-sprite-atlas [OUTPUT] [RUNS]"""
+    if not os.path.isdir(POKEMON_ICONS_FOLDER):
+        print(f"No sprites to pack: {POKEMON_ICONS_FOLDER} does not exist")
+        return 1
+    count, size = write_sprite_atlas(POKEMON_ICONS_FOLDER, output)
+    print(f"Packed {count} sprites ({size / 1024 / 1024:.1f} MB) into {output}")
+
+    atlas = SpriteAtlas(output, POKEMON_ICONS_FOLDER)
+    paths = [os.path.join(POKEMON_ICONS_FOLDER, name) for name in atlas.names()]
+    if not paths:
+        print("FAIL: the new atlas could not be read back")
+        return 1
+
+    def decode_all(load):
+        start = time.perf_counter()
+        for _ in range(int(runs)):
+            for path in paths:
+                load(path)
+        return (time.perf_counter() - start) * 1000.0 / (int(runs) * len(paths))
+
+    def load_loose(path):
+        with Image.open(path) as image:
+            image.load()
+
+    loose_ms = decode_all(load_loose)
+    atlas_ms = decode_all(atlas.image)
+    print(f"loose files  {loose_ms:.3f} ms/sprite")
+    print(f"atlas        {atlas_ms:.3f} ms/sprite")
+    return 0
+
+
+BENCHMARK_COMMANDS = {
+    "--bench-match": bench_match,
+    "--bench-scale": bench_scale,
+    "--bench-capture-soak": bench_capture_soak,
+    "--bench-rpc": bench_rpc,
+    "--build-sprite-atlas": build_sprite_atlas,
+}
 
-        # Always start with alerts disabled, regardless of saved config
-        self.audio_enabled_var.set(False)
-        self.audio_enabled = False
-        self.alert_play_manual = self.load_config_value(CONFIG_KEY_ALERT_PLAY_MANUAL, "1") == "1"
-        self.alert_play_hotkey = self.load_config_value(CONFIG_KEY_ALERT_PLAY_HOTKEY, "1") == "1"
-        self.alert_play_auto = self.load_config_value(CONFIG_KEY_ALERT_PLAY_AUTO, "1") == "1"
 
-        self._last_text_path = self.selected_text_path
-        self._loading_config = False
-        
-        # Update button text after config is loaded
-        self._update_manual_buttons()
+def run_benchmark_cli(argv):
+    """Run a command-line benchmark if one was requested; returns its exit code or None."""
+    if len(argv) < 2 or argv[1] not in BENCHMARK_COMMANDS:
+        return None
+    command = BENCHMARK_COMMANDS[argv[1]]
+    try:
+        inspect.signature(command).bind(*argv[2:])
+    except TypeError:
+        print(command.__doc__)
+        return 2
+    return command(*argv[2:])
+
+
+_benchmark_exit_code = run_benchmark_cli(sys.argv)
+if _benchmark_exit_code is not None:
+    sys.exit(_benchmark_exit_code)
 
 
 # =========================
@@ -7376,6 +10320,7 @@ class ProfileTab:
 # =========================
 register_font(FONT_PATH)
 TOOLTIP_ENABLED = load_tooltip_enabled()
+PRESENCE.set_mode(load_presence_mode())
 
 root = tk.Tk()
 apply_window_style(root)
@@ -7572,6 +10517,19 @@ def on_profile_tab_change(_event=None):
 # notebook.bind("<Double-Button-1>", on_rename_profile)
 notebook.bind("<<NotebookTabChanged>>", on_profile_tab_change)
 
+def on_settings_file_changed(_path):
+    changed = SETTINGS.reload()
+    for profile in profiles:
+        if profile.profile_index in changed:
+            profile.reload_from_settings()
+
+
+FILE_WATCHER = FileWatcher(root)
+root.after_idle(preload_pokemon_dataset)
+FILE_WATCHER.watch("settings", SETTINGS.path, on_settings_file_changed)
+for profile in profiles:
+    profile.watch_files()
+
 hotkeys, global_enabled = load_hotkeys_config()
 hotkey_manager = HotkeyManager(root, get_active_profile, get_profiles)
 hotkey_manager.set_hotkeys(hotkeys)